@@ -1,5 +1,7 @@
+import os
 import sys
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, Annotated, Optional
 
@@ -18,12 +20,12 @@ from fastapi_jsonapi.schema_base import BaseModel
 from fastapi_jsonapi.types_metadata import ClientCanSetId
 from fastapi_jsonapi.views import ViewBase, Operation, OperationConfig
 
-CURRENT_FILE = Path(__file__).resolve()
+CURRENT_FILE = Path(__file__)
 CURRENT_DIR = CURRENT_FILE.parent
-sys.path.append(f"{CURRENT_DIR.parent.parent}")
 db = DB(
     url=make_url(f"sqlite+aiosqlite:///{CURRENT_DIR.absolute()}/db.sqlite3"),
 )
+db.tune_sqlite()
 
 
 class Base(DeclarativeBase):
@@ -59,11 +61,8 @@ class UserInSchema(UserAttributesBaseSchema):
     id: Annotated[int, ClientCanSetId()]
 
 
-class SessionDependency(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
-
+@dataclass
+class SessionDependency:
     session: AsyncSession = Depends(db.session)
 
 
@@ -102,8 +101,7 @@ def add_routes(app: FastAPI):
 async def lifespan(app: FastAPI):
     add_routes(app)
 
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await db.create_all(Base.metadata)
 
     yield
 
@@ -113,7 +111,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="FastAPI and SQLAlchemy",
     lifespan=lifespan,
-    debug=True,
+    debug=os.getenv("APP_DEBUG") == "1",
     default_response_class=JSONResponse,
     docs_url="/docs",
     openapi_url="/openapi.json",
@@ -121,10 +119,12 @@ app = FastAPI(
 
 
 if __name__ == "__main__":
+    sys.path.append(f"{CURRENT_DIR.resolve().parent.parent}")
+
     uvicorn.run(
         f"{CURRENT_FILE.name.replace(CURRENT_FILE.suffix, '')}:app",
         host="0.0.0.0",
         port=8084,
-        reload=True,
+        reload=os.getenv("UVICORN_RELOAD") == "1",
         app_dir=f"{CURRENT_DIR}",
     )
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse as JSONResponse
 
 from fastapi_jsonapi import ApplicationBuilder
 from fastapi_jsonapi.data_layers.base import BaseDataLayer
@@ -21,7 +22,7 @@ class UserView(ViewBase):
     data_layer_cls = MyCustomDataLayer
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=JSONResponse)
 builder = ApplicationBuilder(app)
 builder.add_resource(
     # ...
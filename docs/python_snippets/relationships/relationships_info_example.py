@@ -57,3 +57,7 @@ class ComputerBaseSchema(BaseModel):
             resource_type="user",
         ),
     ] = None
+
+
+# related schemas are defined below UserBaseSchema, resolve its forward references once they exist
+UserBaseSchema.model_rebuild()
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse as JSONResponse
 
 from examples.api_for_sqlalchemy.models import User
 from examples.api_for_sqlalchemy.schemas import UserInSchema, UserPatchSchema, UserSchema
@@ -20,5 +21,5 @@ def add_routes(app: FastAPI):
     )
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=JSONResponse)
 add_routes(app)
@@ -1,25 +1,25 @@
-from typing import Optional, ClassVar
+from dataclasses import dataclass
+from typing import Annotated, Optional, ClassVar
 
 from fastapi import Depends, Header
-from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated
 
 from examples.api_for_sqlalchemy.models.db import DB
 from fastapi_jsonapi.exceptions import Forbidden
 from fastapi_jsonapi.misc.sqla.generics.base import ViewBaseGeneric
 from fastapi_jsonapi.views import ViewBase, Operation, OperationConfig
 
+# one engine (and one connection pool) for the whole process,
+# every request only checks out a connection from it
 db = DB(
     url="sqlite+aiosqlite:///tmp/db.sqlite3",
+    pool_size=10,
+    max_overflow=20,
 )
 
 
-class SessionDependency(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
-
+@dataclass
+class SessionDependency:
     session: AsyncSession = Depends(db.session)
 
 
@@ -34,7 +34,8 @@ async def check_that_user_is_admin(x_auth: Annotated[str, Header()]):
         raise Forbidden(detail="Only admin user have permissions to this endpoint.")
 
 
-class AdminOnlyPermission(BaseModel):
+@dataclass
+class AdminOnlyPermission:
     is_admin: Optional[bool] = Depends(check_that_user_is_admin)
 
 
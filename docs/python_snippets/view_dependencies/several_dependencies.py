@@ -1,7 +1,7 @@
+from dataclasses import dataclass
 from typing import ClassVar
 
 from fastapi import Depends
-from pydantic import BaseModel
 
 from fastapi_jsonapi.misc.sqla.generics.base import ViewBaseGeneric
 from fastapi_jsonapi.views import ViewBase, Operation, OperationConfig
@@ -15,14 +15,17 @@ def two():
     return 2
 
 
-class CommonDependency(BaseModel):
+@dataclass
+class CommonDependency:
     key_1: int = Depends(one)
 
 
-class GetDependency(BaseModel):
+@dataclass
+class GetDependency:
     key_2: int = Depends(two)
 
 
+@dataclass
 class DependencyMix(CommonDependency, GetDependency):
     pass
 
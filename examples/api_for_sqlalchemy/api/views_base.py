@@ -1,7 +1,7 @@
+from dataclasses import dataclass
 from typing import ClassVar
 
 from fastapi import Depends
-from pydantic import BaseModel, ConfigDict
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,13 +14,11 @@ from fastapi_jsonapi.views import Operation, OperationConfig, ViewBase
 db = DB(
     url=make_url(config.SQLA_URI),
 )
+db.tune_sqlite()
 
 
-class SessionDependency(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
-
+@dataclass
+class SessionDependency:
     session: AsyncSession = Depends(db.session)
 
 
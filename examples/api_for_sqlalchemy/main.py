@@ -4,6 +4,7 @@ Main module for w_mount service.
 In module placed db initialization functions, app factory.
 """
 
+import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -16,9 +17,6 @@ from examples.api_for_sqlalchemy.api.views_base import db
 from examples.api_for_sqlalchemy.models.base import Base
 from examples.api_for_sqlalchemy.urls import add_routes
 
-CURRENT_DIR = Path(__file__).resolve().parent
-sys.path.append(f"{CURRENT_DIR.parent.parent}")
-
 
 # noinspection PyUnusedLocal
 @asynccontextmanager
@@ -26,18 +24,17 @@ async def lifespan(app: FastAPI):
     app.config = {"MAX_INCLUDE_DEPTH": 5}
     add_routes(app)
 
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await db.create_all(Base.metadata)
 
     yield
 
-    await db.engine.dispose()
+    await db.dispose()
 
 
 app = FastAPI(
     title="FastAPI and SQLAlchemy",
     lifespan=lifespan,
-    debug=True,
+    debug=os.getenv("APP_DEBUG") == "1",
     default_response_class=JSONResponse,
     docs_url="/docs",
     openapi_url="/openapi.json",
@@ -45,10 +42,13 @@ app = FastAPI(
 
 
 if __name__ == "__main__":
+    CURRENT_DIR = Path(__file__).resolve().parent
+    sys.path.append(f"{CURRENT_DIR.parent.parent}")
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8082,
-        reload=True,
+        reload=os.getenv("UVICORN_RELOAD") == "1",
         app_dir=f"{CURRENT_DIR}",
     )
@@ -1,9 +1,30 @@
 from collections.abc import AsyncIterator
 from typing import Union
 
+from sqlalchemy import MetaData, event, inspect
 from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+SQLITE_PRAGMAS = (
+    # readers don't block the writer and vice versa
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    # 64 MB page cache (negative value is in KiB)
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    https://www.sqlite.org/pragma.html
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class DB:
     def __init__(
@@ -11,19 +32,46 @@ class DB:
         url: Union[str, URL],
         echo: bool = False,
         echo_pool: bool = False,
+        # the default 500 entries are not enough for all the filter / include query variants
+        query_cache_size: int = 1200,
+        **engine_kwargs,
     ):
         self.engine: AsyncEngine = create_async_engine(
             url=url,
             echo=echo,
             echo_pool=echo_pool,
+            query_cache_size=query_cache_size,
+            **engine_kwargs,
         )
 
+        # one session factory for the whole app, sessions are created from it per request
         self.session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
             autocommit=False,
+            autoflush=False,
             bind=self.engine,
             expire_on_commit=False,
         )
 
+    def tune_sqlite(self):
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", set_sqlite_pragmas)
+
+    async def create_all(self, metadata: MetaData):
+        """
+        Create missing tables.
+
+        Plain `metadata.create_all` opens a write transaction and checks every table one by one,
+        so look up the existing table names once and skip it entirely when nothing is missing.
+        """
+        async with self.engine.connect() as conn:
+            existing_tables = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+
+        if existing_tables.issuperset(metadata.tables):
+            return
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
     async def dispose(self):
         await self.engine.dispose()
 
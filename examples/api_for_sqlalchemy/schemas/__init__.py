@@ -85,3 +85,35 @@ __all__ = (
     "WorkplacePatchSchema",
     "WorkplaceSchema",
 )
+
+
+# all schemas are imported here, so forward references between them are resolved
+# once at import time instead of on the first use of each schema
+for _schema in (
+    ChildInSchema,
+    ChildPatchSchema,
+    ChildSchema,
+    ComputerInSchema,
+    ComputerPatchSchema,
+    ComputerSchema,
+    CustomUserAttributesSchema,
+    ParentInSchema,
+    ParentPatchSchema,
+    ParentSchema,
+    ParentToChildAssociationSchema,
+    PostCommentSchema,
+    PostInSchema,
+    PostPatchSchema,
+    PostSchema,
+    UserBioBaseSchema,
+    UserBioInSchema,
+    UserBioPatchSchema,
+    UserInSchema,
+    UserInSchemaAllowIdOnPost,
+    UserPatchSchema,
+    UserSchema,
+    WorkplaceInSchema,
+    WorkplacePatchSchema,
+    WorkplaceSchema,
+):
+    _schema.model_rebuild()
@@ -3,7 +3,6 @@
 from fastapi import APIRouter, FastAPI
 
 from fastapi_jsonapi import ApplicationBuilder
-from fastapi_jsonapi.atomic import AtomicOperations
 
 from .api.views_base import ViewBase
 from .models import (
@@ -131,9 +130,5 @@ def add_routes(app: FastAPI):
         schema_in_patch=WorkplacePatchSchema,
         schema_in_post=WorkplaceInSchema,
     )
+    # mounts the resource routers and the atomic operations router
     builder.initialize()
-
-    atomic = AtomicOperations()
-
-    app.include_router(router, prefix="")
-    app.include_router(atomic.router, prefix="")
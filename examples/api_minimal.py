@@ -1,5 +1,7 @@
+import os
 import sys
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, ClassVar, Optional
 
@@ -17,8 +19,7 @@ from fastapi_jsonapi.misc.sqla.generics.base import ViewBaseGeneric
 from fastapi_jsonapi.schema_base import BaseModel
 from fastapi_jsonapi.views import Operation, OperationConfig, ViewBase
 
-CURRENT_DIR = Path(__file__).resolve().parent
-sys.path.append(f"{CURRENT_DIR.parent.parent}")
+CURRENT_DIR = Path(__file__).parent
 db = DB(
     url=make_url(f"sqlite+aiosqlite:///{CURRENT_DIR}/db.sqlite3"),
 )
@@ -45,11 +46,8 @@ class UserSchema(BaseModel):
     name: str
 
 
-class SessionDependency(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
-
+@dataclass
+class SessionDependency:
     session: AsyncSession = Depends(db.session)
 
 
@@ -86,8 +84,7 @@ def add_routes(app: FastAPI):
 async def lifespan(app: FastAPI):
     add_routes(app)
 
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await db.create_all(Base.metadata)
 
     yield
 
@@ -97,7 +94,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="FastAPI and SQLAlchemy",
     lifespan=lifespan,
-    debug=True,
+    debug=os.getenv("APP_DEBUG") == "1",
     default_response_class=JSONResponse,
     docs_url="/docs",
     openapi_url="/openapi.json",
@@ -105,6 +102,8 @@ app = FastAPI(
 
 
 if __name__ == "__main__":
+    sys.path.append(f"{CURRENT_DIR.resolve().parent.parent}")
+
     uvicorn.run(
         app,
         host="0.0.0.0",
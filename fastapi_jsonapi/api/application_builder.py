@@ -1,21 +1,25 @@
+import contextlib
+from collections import deque
 from itertools import product
-from queue import Queue
 from typing import Callable, Iterable, Optional, Type
 
 from fastapi import APIRouter, FastAPI, status
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
 from fastapi_jsonapi.api.endpoint_builder import EndpointsBuilder
 from fastapi_jsonapi.api.schemas import ResourceData
 from fastapi_jsonapi.atomic import AtomicOperations
 from fastapi_jsonapi.data_typing import TypeModel
-from fastapi_jsonapi.exceptions import ExceptionResponseSchema, HTTPException
+from fastapi_jsonapi.exceptions import BadRequest, ExceptionResponseSchema, HTTPException
 from fastapi_jsonapi.exceptions.handlers import base_exception_handler
 from fastapi_jsonapi.schema import get_schema_from_field_annotation
 from fastapi_jsonapi.schema_builder import SchemaBuilder
 from fastapi_jsonapi.storages.models_storage import models_storage
 from fastapi_jsonapi.storages.schemas_storage import schemas_storage
 from fastapi_jsonapi.storages.views_storage import views_storage
+from fastapi_jsonapi.utils.schema_caches import clear_schema_caches
 from fastapi_jsonapi.views import Operation, ViewBase
 
 
@@ -28,6 +32,7 @@ class ApplicationBuilder:
         app: FastAPI,
         base_router: Optional[APIRouter] = None,
         exception_handler: Optional[Callable] = None,
+        response_class: Optional[Type[Response]] = None,
         **base_router_include_kwargs,
     ):
         self._app: FastAPI = app
@@ -36,6 +41,7 @@ class ApplicationBuilder:
         self._routers: dict[str, APIRouter] = {}
         self._router_include_kwargs: dict[str, dict] = {}
         self._paths = set()
+        self._pending_resources: dict[str, dict] = {}
         self._resource_data: dict[str, ResourceData] = {}
         self._exception_handler: Callable = base_exception_handler
         self._initialized: bool = False
@@ -43,6 +49,13 @@ class ApplicationBuilder:
         if exception_handler is not None:
             self._exception_handler = exception_handler
 
+        # keep the app default if it was set explicitly, otherwise serialize responses with orjson
+        if response_class is None:
+            response_class = app.router.default_response_class
+            if isinstance(response_class, DefaultPlaceholder):
+                response_class = ORJSONResponse
+        self._response_class: Type[Response] = response_class
+
     def add_resource(
         self,
         path: str,
@@ -67,7 +80,7 @@ class ApplicationBuilder:
             msg = "Can't add resource after app initialization"
             raise ApplicationBuilderError(msg)
 
-        if resource_type in self._resource_data:
+        if resource_type in self._pending_resources:
             msg = f"Resource {resource_type!r} already registered"
             raise ApplicationBuilderError(msg)
 
@@ -77,11 +90,6 @@ class ApplicationBuilder:
 
         models_storage.add_model(resource_type, model, model_id_field_name)
         views_storage.add_view(resource_type, view)
-        dto = SchemaBuilder(resource_type).create_schemas(
-            schema=schema,
-            schema_in_post=schema_in_post,
-            schema_in_patch=schema_in_patch,
-        )
 
         resource_operations = []
         for operation in operations:
@@ -93,27 +101,23 @@ class ApplicationBuilder:
 
         resource_operations = resource_operations or Operation.real_operations()
 
-        resource_data = ResourceData(
-            path=path,
-            router=router,
-            tags=list(tags),
-            view=view,
-            model=model,
-            source_schema=schema,
-            schema_in_post=schema_in_post,
-            schema_in_post_data=dto.schema_in_post_data,
-            schema_in_patch=schema_in_patch,
-            schema_in_patch_data=dto.schema_in_patch_data,
-            detail_response_schema=dto.detail_response_schema,
-            list_response_schema=dto.list_response_schema,
-            pagination_default_size=pagination_default_size,
-            pagination_default_number=pagination_default_number,
-            pagination_default_offset=pagination_default_offset,
-            pagination_default_limit=pagination_default_limit,
-            operations=resource_operations,
-            ending_slash=ending_slash,
-        )
-        self._resource_data[resource_type] = resource_data
+        # schemas are built for all resources at once in initialize
+        self._pending_resources[resource_type] = {
+            "path": path,
+            "router": router,
+            "tags": list(tags),
+            "view": view,
+            "model": model,
+            "source_schema": schema,
+            "schema_in_post": schema_in_post,
+            "schema_in_patch": schema_in_patch,
+            "pagination_default_size": pagination_default_size,
+            "pagination_default_number": pagination_default_number,
+            "pagination_default_offset": pagination_default_offset,
+            "pagination_default_limit": pagination_default_limit,
+            "operations": resource_operations,
+            "ending_slash": ending_slash,
+        }
 
         router = router or self._base_router
         self._routers[resource_type] = router
@@ -127,7 +131,10 @@ class ApplicationBuilder:
             raise Exception(msg)
 
         self._initialized = True
+        self._build_resources_data()
         self._traverse_relationship_schemas()
+        # schemas are complete now, drop anything derived from them while they were being built
+        clear_schema_caches()
         self._app.add_exception_handler(HTTPException, self._exception_handler)
 
         status_codes = self._get_status_codes()
@@ -162,6 +169,7 @@ class ApplicationBuilder:
                     status_code=status_codes[operation],
                     endpoint=endpoint,
                     name=name,
+                    response_class=self._response_class,
                 )
 
             relationships_info = schemas_storage.get_relationships_info(
@@ -198,6 +206,7 @@ class ApplicationBuilder:
                     status_code=status_codes[operation],
                     endpoint=endpoint,
                     name=name,
+                    response_class=self._response_class,
                 )
 
         registered_routers = set()
@@ -293,18 +302,31 @@ class ApplicationBuilder:
 
         return f"{path}{suffix}"
 
+    def _build_resources_data(self):
+        for resource_type, resource_kwargs in self._pending_resources.items():
+            dto = SchemaBuilder(resource_type).create_schemas(
+                schema=resource_kwargs["source_schema"],
+                schema_in_post=resource_kwargs["schema_in_post"],
+                schema_in_patch=resource_kwargs["schema_in_patch"],
+            )
+            self._resource_data[resource_type] = ResourceData(
+                **resource_kwargs,
+                schema_in_post_data=dto.schema_in_post_data,
+                schema_in_patch_data=dto.schema_in_patch_data,
+                detail_response_schema=dto.detail_response_schema,
+                list_response_schema=dto.list_response_schema,
+            )
+
     def _traverse_relationship_schemas(self):
         # User can have relationship resources without having CRUD operations for these resource types.
         # So the SchemaStorage will not be filled with schemas without passing through the relationships.
 
-        operations = Queue()
+        # plain deque, the traversal is single threaded and doesn't need Queue locking
+        operations = deque(product(self._resource_data, ("create", "update", "get")))
         handled_operations = set()
 
-        for item in product(self._resource_data, ("create", "update", "get")):
-            operations.put(item)
-
-        while not operations.empty():
-            if (operation := operations.get()) in handled_operations:
+        while operations:
+            if (operation := operations.popleft()) in handled_operations:
                 continue
 
             handled_operations.add(operation)
@@ -317,6 +339,15 @@ class ApplicationBuilder:
             relationships_info = schemas_storage.get_relationships_info(resource_type, operation_type).items()
 
             for relationship_name, info in relationships_info:
+                # resolve relationship models once at startup, requests only hit the lookup cache;
+                # schema-only relationships (e.g. for a custom data layer) have no model relationship
+                with contextlib.suppress(BadRequest):
+                    models_storage.search_relationship_model(
+                        resource_type=resource_type,
+                        model=parent_model,
+                        field_name=relationship_name,
+                    )
+
                 if schemas_storage.has_operation(info.resource_type, operation_type="get"):
                     continue
 
@@ -358,4 +389,4 @@ class ApplicationBuilder:
                     relationships_info=dto.relationships_info,
                     model_validators=dto.model_validators,
                 )
-                operations.put((info.resource_type, "get"))
+                operations.append((info.resource_type, "get"))
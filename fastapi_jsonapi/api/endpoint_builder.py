@@ -1,3 +1,4 @@
+from dataclasses import dataclass, is_dataclass
 from inspect import Parameter, Signature, signature
 from typing import Any, Callable, Iterable, Literal, Optional, Type
 
@@ -53,6 +54,14 @@ class EndpointsBuilder:
 
         same_type = target_config.dependencies is common_config.dependencies
         if not same_type and all([target_config.dependencies, common_config.dependencies]):
+            if is_dataclass(common_config.dependencies) != is_dataclass(target_config.dependencies):
+                msg = (
+                    f"Can't merge dependencies of {view.__name__} for {operation.name}: "
+                    f"{common_config.dependencies.__name__} and {target_config.dependencies.__name__} "
+                    f"should be both pydantic models or both dataclasses"
+                )
+                raise ValueError(msg)
+
             dependencies_model = type(
                 f"{view.__name__}{operation.name.title()}MethodDependencyModel",
                 (
@@ -62,15 +71,32 @@ class EndpointsBuilder:
                 ),
                 {},
             )
+            if is_dataclass(dependencies_model):
+                # collect fields of both parents
+                dependencies_model = dataclass(dependencies_model)
 
+        handler_config = target_config if target_config.handler else common_config
         new_method_config = OperationConfig(
             dependencies=dependencies_model,
-            prepare_data_layer_kwargs=target_config.handler or common_config.handler,
+            prepare_data_layer_kwargs=handler_config.handler,
+            run_inline=handler_config.run_inline,
+        )
+        # the common handler is run by the merged config, it's not run separately
+        new_method_config._includes_common_handler = target_config._includes_common_handler or (
+            handler_config is common_config and common_config.handler is not None
         )
         view.operation_dependencies[operation] = new_method_config
 
         return new_method_config
 
+    @classmethod
+    def _resolve_operation_configs(cls, view: Type[ViewBase], operation: Operation) -> tuple[OperationConfig, ...]:
+        """
+        Configs with handlers to run for the endpoint, resolved once on the endpoint creation.
+        """
+        cls._update_operation_config(view, operation)
+        return view.get_operation_configs(operation)
+
     def _create_pagination_query_params(self) -> list[Parameter]:
         size = Query(self._data.pagination_default_size, alias="page[size]", title="pagination_page_size")
         number = Query(self._data.pagination_default_number, alias="page[number]", title="pagination_page_number")
@@ -208,6 +234,8 @@ class EndpointsBuilder:
         schema_in_post_data: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             data: schema_in_post_data = Body(embed=True),
@@ -219,6 +247,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_post_resource_list(data_create=data, **extra_view_deps)
@@ -241,6 +270,8 @@ class EndpointsBuilder:
         schema_in_patch_data: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             data: schema_in_patch_data = Body(embed=True),
@@ -253,6 +284,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_update_resource(obj_id=obj_id, data_update=data, **extra_view_deps)
@@ -274,6 +306,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             obj_id: str = Path(...),
@@ -285,6 +319,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_delete_resource(obj_id=obj_id, **extra_view_deps)
@@ -306,6 +341,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             obj_id: str = Path(...),
@@ -317,6 +354,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_get_resource_detail(obj_id=obj_id, **extra_view_deps)
@@ -339,6 +377,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, Operation.GET)
+
         async def wrapper(
             request: Request,
             obj_id: str = Path(...),
@@ -350,6 +390,7 @@ class EndpointsBuilder:
                 operation=Operation.GET,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view.handle_get_resource_relationship(
@@ -378,6 +419,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, Operation.GET_LIST)
+
         async def wrapper(
             request: Request,
             obj_id: str = Path(...),
@@ -389,6 +432,7 @@ class EndpointsBuilder:
                 operation=Operation.GET_LIST,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view.handle_get_resource_relationship_list(
@@ -416,6 +460,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             **extra_view_deps,
@@ -426,6 +472,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_get_resource_list(**extra_view_deps)
@@ -448,6 +495,8 @@ class EndpointsBuilder:
         source_schema: Type[TypeSchema],
         **view_options,
     ):
+        operation_configs = self._resolve_operation_configs(view, operation)
+
         async def wrapper(
             request: Request,
             **extra_view_deps,
@@ -458,6 +507,7 @@ class EndpointsBuilder:
                 operation=operation,
                 model=model,
                 schema=source_schema,
+                operation_configs=operation_configs,
                 **view_options,
             )
             return await view_instance.handle_delete_resource_list(**extra_view_deps)
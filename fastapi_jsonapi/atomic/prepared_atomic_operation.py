@@ -211,7 +211,7 @@ class OperationUpdate(OperationBase):
         # use outer schema wrapper because we need this error path:
         # `{'loc': ['data', 'attributes', 'name']`
         # and not `{'loc': ['attributes', 'name']`
-        schema_in_update = schemas_storage.get_schema_in(self.resource_type, operation_type="create")
+        schema_in_update = schemas_storage.get_schema_in(self.resource_type, operation_type="update")
         data_in = schema_in_update(data=self.data.model_dump(exclude_unset=True))
         obj_id = (self.ref and self.ref.id) or (self.data and self.data.id)
         return await self.view.process_update_object(
@@ -8,12 +8,12 @@ you must inherit from this base class
 from typing import Optional, Type
 
 from fastapi import Request
-from pydantic import TypeAdapter
 
 from fastapi_jsonapi.common import search_client_can_set_id
 from fastapi_jsonapi.data_typing import TypeModel, TypeSchema
 from fastapi_jsonapi.querystring import QueryStringManager
 from fastapi_jsonapi.schema import BaseJSONAPIItemInSchema
+from fastapi_jsonapi.validation_utils import get_type_adapter
 from fastapi_jsonapi.views import RelationshipRequestInfo
 
 
@@ -77,7 +77,7 @@ class BaseDataLayer:
         if can_set_id := search_client_can_set_id.first(field):
             id_value = data_create.id
             if can_set_id.cast_type:
-                id_value = TypeAdapter(can_set_id.cast_type).validate_python(id_value)
+                id_value = get_type_adapter(can_set_id.cast_type).validate_python(id_value)
             model_kwargs["id"] = id_value
 
         return model_kwargs
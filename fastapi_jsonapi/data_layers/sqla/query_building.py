@@ -4,7 +4,7 @@ import logging
 from collections import defaultdict
 from typing import Any, Optional, Type, Union, get_args
 
-from pydantic import BaseModel, ConfigDict, PydanticSchemaGenerationError, TypeAdapter
+from pydantic import BaseModel, ConfigDict, PydanticSchemaGenerationError
 
 # noinspection PyProtectedMember
 from pydantic._internal._typing_extra import is_none_type
@@ -24,10 +24,12 @@ from fastapi_jsonapi.exceptions.json_api import HTTPException, InternalServerErr
 from fastapi_jsonapi.schema import (
     JSONAPISchemaIntrospectionError,
     get_model_field,
-    get_relationship_fields_names,
-    get_schema_from_field_annotation,
+    get_relationship_fields,
 )
+from fastapi_jsonapi.storages.models_storage import models_storage
 from fastapi_jsonapi.types_metadata import CustomFilterSQL, CustomSortSQL
+from fastapi_jsonapi.utils.schema_caches import schema_cache
+from fastapi_jsonapi.validation_utils import get_type_adapter
 
 log = logging.getLogger(__name__)
 
@@ -78,7 +80,7 @@ def cast_value_with_schema(field_types: list[Type], value: Any) -> tuple[Any, li
     for field_type in field_types:
         try:
             # don't allow arbitrary types, we don't know their behaviour
-            cast_type = TypeAdapter(field_type).validate_python
+            cast_type = get_type_adapter(field_type).validate_python
         except PydanticSchemaGenerationError:
             cast_type = field_type
 
@@ -243,13 +245,18 @@ def gather_relationships_info(
     )
     target_relationship_name = relationship_path[target_relationship_idx]
 
-    relationships_names = get_relationship_fields_names(schema)
-    if target_relationship_name not in relationships_names:
+    for relationship_name, _, target_schema in get_relationship_fields(schema):
+        if relationship_name == target_relationship_name:
+            break
+    else:
         msg = f"There is no relationship {target_relationship_name!r} defined in schema {schema.__name__!r}"
         raise InvalidField(msg)
 
-    target_schema = get_schema_from_field_annotation(schema.model_fields[target_relationship_name])
-    target_model = getattr(model, target_relationship_name).property.mapper.class_
+    target_model = models_storage.search_relationship_model(
+        resource_type=entrypoint_resource_type,
+        model=model,
+        field_name=target_relationship_name,
+    )
 
     if prev_aliased_model:
         join_column = get_model_column(
@@ -339,6 +346,15 @@ def prepare_relationships_info(
     )
 
 
+@schema_cache
+def get_custom_filters_sql(schema_field: FieldInfo) -> dict[str, CustomFilterSQL]:
+    """Map op -> custom filter of a field, the first declared filter wins for a duplicated op"""
+    custom_filters: dict[str, CustomFilterSQL] = {}
+    for filter_sql in search_custom_filter_sql.iterate(field=schema_field):
+        custom_filters.setdefault(filter_sql.op, filter_sql)
+    return custom_filters
+
+
 def build_terminal_node_filter_expressions(
     filter_item: dict,
     target_schema: Type[TypeSchema],
@@ -369,13 +385,7 @@ def build_terminal_node_filter_expressions(
     schema_field = target_schema.model_fields[field_name]
 
     filter_operator = filter_item["op"]
-    custom_filter_sql: Optional[CustomFilterSQL] = None
-    for filter_sql in search_custom_filter_sql.iterate(field=schema_field):
-        if filter_sql.op == filter_operator:
-            custom_filter_sql = filter_sql
-            break
-
-    if custom_filter_sql is None:
+    if (custom_filter_sql := get_custom_filters_sql(schema_field).get(filter_operator)) is None:
         return build_filter_expression(
             schema_field=schema_field,
             model_column=model_column,
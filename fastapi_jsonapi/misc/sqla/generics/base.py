@@ -3,4 +3,6 @@ from fastapi_jsonapi.views.view_base import ViewBase
 
 
 class ViewBaseGeneric(ViewBase):
+    __slots__ = ()
+
     data_layer_cls = SqlalchemyDataLayer
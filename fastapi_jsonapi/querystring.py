@@ -1,5 +1,6 @@
 """Helper to deal with querystring parameters according to jsonapi specification."""
 
+import re
 from collections import defaultdict
 from functools import cached_property
 from typing import Any, Optional, Type
@@ -19,6 +20,9 @@ from fastapi_jsonapi.exceptions import (
 )
 from fastapi_jsonapi.storages import schemas_storage
 
+# "fields[user]" -> "user"
+ITEM_KEY_PATTERN = re.compile(r"\[([^\]]*)\]")
+
 
 class PaginationQueryStringManager(BaseModel):
     """
@@ -67,18 +71,23 @@ class QueryStringManager:
         self.ALLOW_DISABLE_PAGINATION: bool = self.config.get("ALLOW_DISABLE_PAGINATION", True)
         self.MAX_PAGE_SIZE: int = self.config.get("MAX_PAGE_SIZE", 10000)
         self.MAX_INCLUDE_DEPTH: int = self.config.get("MAX_INCLUDE_DEPTH", 3)
-        self.headers: HeadersQueryStringManager = HeadersQueryStringManager(**dict(self.request.headers))
+
+    @cached_property
+    def headers(self) -> HeadersQueryStringManager:
+        return HeadersQueryStringManager(**dict(self.request.headers))
+
+    @cached_property
+    def _unquoted_items(self) -> list[tuple[str, str]]:
+        return [(unquote(raw_key), value) for raw_key, value in self.qs.multi_items()]
 
     @classmethod
     def extract_item_key(cls, key: str) -> str:
-        try:
-            key_start = key.index("[") + 1
-            key_end = key.index("]")
-            return key[key_start:key_end]
-        except Exception:
+        if (match := ITEM_KEY_PATTERN.search(key)) is None:
             msg = "Parse error"
             raise BadRequest(msg, parameter=key)
 
+        return match.group(1)
+
     def _get_unique_key_values(self, name: str) -> dict[str, str]:
         """
         Return a dict containing key / values items for a given key, used for items like filters, page, etc.
@@ -89,8 +98,7 @@ class QueryStringManager:
         """
         results = {}
 
-        for raw_key, value in self.qs.multi_items():
-            key = unquote(raw_key)
+        for key, value in self._unquoted_items:
             if not key.startswith(name):
                 continue
 
@@ -102,8 +110,7 @@ class QueryStringManager:
     def _get_multiple_key_values(self, name: str) -> dict[str, list]:
         results = defaultdict(list)
 
-        for raw_key, value in self.qs.multi_items():
-            key = unquote(raw_key)
+        for key, value in self._unquoted_items:
             if not key.startswith(name):
                 continue
 
@@ -130,7 +137,7 @@ class QueryStringManager:
             if key.startswith(self.managed_keys) or self._get_unique_key_values("filter[")
         }
 
-    @property
+    @cached_property
     def filters(self) -> list[dict]:
         """
         Return filters from query string.
@@ -158,7 +165,7 @@ class QueryStringManager:
 
         return results
 
-    @property
+    @cached_property
     def sorts(self) -> list[dict]:
         if (sort_q := self.qs.get("sort")) is None:
             return []
@@ -215,7 +222,7 @@ class QueryStringManager:
 
         return pagination
 
-    @property
+    @cached_property
     def fields(self) -> dict[str, set]:
         """
         Return fields wanted by client.
@@ -248,7 +255,7 @@ class QueryStringManager:
 
         return {resource_type: set(field_names) for resource_type, field_names in fields.items()}
 
-    @property
+    @cached_property
     def include(self) -> list[str]:
         """
         Return fields to include.
@@ -6,22 +6,20 @@ Pydantic (for FastAPI).
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from inspect import isclass
-from types import GenericAlias
 from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Type, Union, get_args
 
 from fastapi import FastAPI
 from pydantic import BaseModel, ConfigDict, Field
 
-# noinspection PyProtectedMember
-from pydantic._internal._typing_extra import is_none_type
-
 # noinspection PyProtectedMember
 from pydantic.fields import FieldInfo
 
 from fastapi_jsonapi.common import search_relationship_info
 from fastapi_jsonapi.types_metadata import RelationshipInfo
+from fastapi_jsonapi.utils.schema_caches import schema_cache
 
 if TYPE_CHECKING:
     from fastapi_jsonapi.data_typing import TypeSchema
@@ -30,11 +28,22 @@ if TYPE_CHECKING:
 class BaseJSONAPIRelationshipSchema(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
     )
 
     id: str = Field(default=..., description="Related object ID")
     type: str = Field(default=..., description="Type of the related resource object")
 
+    @classmethod
+    def fast_build(cls, *, id: str, type: str) -> BaseJSONAPIRelationshipSchema:  # noqa: A002
+        """
+        Build resource identifier from trusted values without validation.
+
+        :param id: related object id, already converted to str.
+        :param type: related resource type.
+        """
+        return cls.model_construct(id=id, type=type)
+
 
 class BaseJSONAPIRelationshipDataToOneSchema(BaseModel):
     data: BaseJSONAPIRelationshipSchema
@@ -93,9 +102,17 @@ class JSONAPIDocumentObjectSchema(BaseModel):
     https://jsonapi.org/format/#document-jsonapi-object
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
     version: str = Field(default="1.0", description="json-api версия")
 
 
+# frozen, so one instance is shared by every result instead of a copy per result
+_jsonapi_document_object = JSONAPIDocumentObjectSchema()
+
+
 class JSONAPIObjectSchema(BaseJSONAPIObjectSchema):
     """JSON:API base object schema."""
 
@@ -114,7 +131,7 @@ class BaseJSONAPIResultSchema(BaseModel):
     )
 
     meta: Optional[JSONAPIResultListMetaSchema] = Field(default=None, description="JSON:API metadata")
-    jsonapi: JSONAPIDocumentObjectSchema = JSONAPIDocumentObjectSchema()
+    jsonapi: JSONAPIDocumentObjectSchema = Field(default_factory=lambda: _jsonapi_document_object)
 
 
 class JSONAPIResultListSchema(BaseJSONAPIResultSchema):
@@ -184,7 +201,8 @@ class SchemasInfoDTO:
 
     field_schemas: dict[str, Type[BaseModel]]
 
-    model_validators: dict
+    # (before, after) model validators
+    model_validators: tuple[dict, dict]
 
 
 def get_model_field(schema: Type["TypeSchema"], field: str) -> str:
@@ -205,23 +223,37 @@ def get_model_field(schema: Type["TypeSchema"], field: str) -> str:
     :return: the name of the field in the model
     :raises Exception: if the schema from parameter has no attribute for parameter.
     """
-    if schema.model_fields.get(field) is None:
+    if field not in schema.model_fields:
         msg = f"{schema.__name__} has no attribute {field}"
         raise JSONAPISchemaIntrospectionError(msg)
     return field
 
 
-def get_relationship_fields_names(schema: Type["TypeSchema"]) -> set[str]:
+@schema_cache
+def get_relationship_fields(
+    schema: Type[TypeSchema],
+) -> tuple[tuple[str, RelationshipInfo, Optional[Type[TypeSchema]]], ...]:
+    """
+    Scan schema fields for relationship metadata once per schema class.
+
+    :param schema: a schemas schema
+    :return: (field name, relationship info, related schema) for each relationship field
+    """
+    return tuple(
+        (name, info, get_schema_from_field_annotation(field))
+        for name, field in schema.model_fields.items()
+        if (info := search_relationship_info.first(field))
+    )
+
+
+@schema_cache
+def get_relationship_fields_names(schema: Type["TypeSchema"]) -> frozenset[str]:
     """
     Return relationship fields of a schema.
 
     :param schema: a schemas schema
     """
-    names: set[str] = set()
-    for i_name, i_type in schema.model_fields.items():
-        if search_relationship_info.first(i_type):
-            names.add(i_name)
-    return names
+    return frozenset(name for name, _, _ in get_relationship_fields(schema))
 
 
 def get_schema_from_type(resource_type: str, app: FastAPI) -> Type[BaseModel]:
@@ -231,14 +263,13 @@ def get_schema_from_type(resource_type: str, app: FastAPI) -> Type[BaseModel]:
     :param resource_type: the type of the resource.
     :param app: FastAPI app instance.
     :return Schema: the schema class.
-    :raises Exception: if the schema not found for this resource type.
+    :raises JSONAPISchemaIntrospectionError: if the schema not found for this resource type.
     """
-    schemas: dict[str, Type[BaseModel]] = getattr(app, "schemas", {})
-    try:
-        return schemas[resource_type]
-    except KeyError:
+    schemas: Optional[dict[str, Type[BaseModel]]] = getattr(app, "schemas", None)
+    if schemas is None or (schema := schemas.get(resource_type)) is None:
         msg = f"Couldn't find schema for type: {resource_type}"
-        raise Exception(msg)
+        raise JSONAPISchemaIntrospectionError(msg)
+    return schema
 
 
 def get_schema_from_field_annotation(field: FieldInfo) -> Optional[Type[TypeSchema]]:
@@ -247,17 +278,23 @@ def get_schema_from_field_annotation(field: FieldInfo) -> Optional[Type[TypeSche
     if isclass(annotation_) and issubclass(annotation_, BaseModel):
         return annotation_
 
-    choices = list(get_args(field.annotation))
-    while choices:
-        elem = choices.pop(0)
-        if isinstance(elem, GenericAlias):
-            choices.extend(get_args(elem))
-            continue
+    try:
+        return _get_schema_from_annotation(annotation_)
+    except TypeError:
+        # unhashable annotation
+        return _get_schema_from_annotation.__wrapped__(annotation_)
 
-        if is_none_type(elem):
-            continue
 
-        if isclass(elem) and issubclass(elem, BaseModel):
+@schema_cache
+def _get_schema_from_annotation(annotation_: Any) -> Optional[Type[TypeSchema]]:
+    """Result depends only on the annotation, so fields with the same annotation share it"""
+    choices = deque(get_args(annotation_))
+    while choices:
+        elem = choices.popleft()
+        # any parametrized alias, both list[X] and typing.List[X]
+        if elem_args := get_args(elem):
+            choices.extend(elem_args)
+        elif isclass(elem) and issubclass(elem, BaseModel):
             return elem
 
     return None
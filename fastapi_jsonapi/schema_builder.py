@@ -9,7 +9,7 @@ from pydantic import BaseModel as PydanticBaseModel
 # noinspection PyProtectedMember
 from pydantic.fields import FieldInfo
 
-from fastapi_jsonapi.common import get_relationship_info_from_field_metadata, search_client_can_set_id
+from fastapi_jsonapi.common import search_client_can_set_id
 from fastapi_jsonapi.schema import (
     BaseJSONAPIDataInSchema,
     BaseJSONAPIItemInSchema,
@@ -24,12 +24,12 @@ from fastapi_jsonapi.schema import (
     JSONAPIResultListSchema,
     RelationshipInfoSchema,
     SchemasInfoDTO,
-    get_schema_from_field_annotation,
+    get_relationship_fields,
 )
 from fastapi_jsonapi.schema_base import BaseModel, Field, registry
 from fastapi_jsonapi.storages.schemas_storage import schemas_storage
 from fastapi_jsonapi.types_metadata import RelationshipInfo
-from fastapi_jsonapi.validation_utils import extract_validators
+from fastapi_jsonapi.validation_utils import extract_validators, get_model_validators
 
 log = logging.getLogger(__name__)
 JSONAPIObjectSchemaType = TypeVar("JSONAPIObjectSchemaType", bound=PydanticBaseModel)
@@ -213,8 +213,14 @@ class SchemaBuilder:
 
         # required! otherwise we get ForwardRef
         schema.model_rebuild(_types_namespace=registry.schemas)
+        # builds the per-schema relationship index at registration, request time lookups reuse it
+        schema_relationships = {
+            name: (relationship_info, related_schema)
+            for name, relationship_info, related_schema in get_relationship_fields(schema)
+        }
         for name, field in (schema.model_fields or {}).items():
-            if relationship_info := get_relationship_info_from_field_metadata(field):
+            if name in schema_relationships:
+                relationship_info, related_schema = schema_relationships[name]
                 relationships_info[name] = (relationship_info, field)
                 relationship_schema = self.create_relationship_data_schema(
                     field_name=name,
@@ -229,7 +235,7 @@ class SchemaBuilder:
                     has_required_relationship = True
                 relationships_schema_fields[name] = (relationship_schema, relationship_field)
                 # works both for to-one and to-many
-                if related_schema := get_schema_from_field_annotation(field):
+                if related_schema:
                     included_schemas.append((name, related_schema, relationship_info.resource_type))
             elif name == "id":
                 id_validators, _ = extract_validators(
@@ -282,7 +288,7 @@ class SchemaBuilder:
             has_required_relationship=has_required_relationship,
             included_schemas=included_schemas,
             field_schemas=field_schemas,
-            model_validators=model_validators,
+            model_validators=get_model_validators(schema),
         )
 
     @classmethod
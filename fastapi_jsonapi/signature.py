@@ -1,10 +1,10 @@
 """Functions for extracting and updating signatures."""
 
-import inspect
 import logging
-from enum import Enum
+from dataclasses import MISSING, fields, is_dataclass
+from enum import EnumMeta
 from inspect import Parameter, Signature
-from typing import Any, Optional, Type, Union, get_args, get_origin
+from typing import Any, Optional, Type, Union, get_args, get_origin, get_type_hints
 
 from fastapi import Query
 
@@ -18,6 +18,7 @@ from pydantic.fields import FieldInfo
 from fastapi_jsonapi.common import get_relationship_info_from_field_metadata
 from fastapi_jsonapi.data_typing import TypeSchema
 from fastapi_jsonapi.schema_base import BaseModel
+from fastapi_jsonapi.utils.schema_caches import schema_cache
 
 log = logging.getLogger(__name__)
 
@@ -45,11 +46,8 @@ def create_filter_parameter(
 ) -> Parameter:
     filter_alias = field.alias or name
     query_filter_name = f"filter[{filter_alias}]"
-    if (
-        inspect.isclass(field.annotation)
-        and issubclass(field.annotation, Enum)
-        and hasattr(field.annotation, "values")
-    ):
+    # a single metaclass check instead of isclass + issubclass
+    if isinstance(field.annotation, EnumMeta) and hasattr(field.annotation, "values"):
         default = Query(None, alias=query_filter_name, enum=list(field.annotation))
         type_field = str
     elif not field_annotation_is_scalar_sequence(field.annotation):
@@ -68,10 +66,18 @@ def create_filter_parameter(
 
 
 def create_additional_query_params(schema: type[BaseModel]) -> tuple[list[Parameter], list[Parameter]]:
+    if not schema:
+        return [], []
+
+    filter_params, include_params = _create_additional_query_params(schema)
+    return list(filter_params), list(include_params)
+
+
+@schema_cache
+def _create_additional_query_params(schema: type[BaseModel]) -> tuple[tuple[Parameter, ...], tuple[Parameter, ...]]:
+    """Build filter and include params once per schema, endpoints of one resource share them."""
     filter_params: list[Parameter] = []
     include_params: list[Parameter] = []
-    if not schema:
-        return filter_params, include_params
 
     available_includes_names = []
     for name, field in schema.model_fields.items():
@@ -85,7 +91,7 @@ def create_additional_query_params(schema: type[BaseModel]) -> tuple[list[Parame
             filter_params.append(parameter)
 
     if available_includes_names:
-        doc_available_includes = "\n".join([f"* `{name}`" for name in available_includes_names])
+        doc_available_includes = "\n".join(f"* `{name}`" for name in available_includes_names)
         include_param = Parameter(
             "_jsonapi_include",
             kind=Parameter.POSITIONAL_OR_KEYWORD,
@@ -97,12 +103,40 @@ def create_additional_query_params(schema: type[BaseModel]) -> tuple[list[Parame
             ),
         )
         include_params.append(include_param)
-    return filter_params, include_params
+    return tuple(filter_params), tuple(include_params)
 
 
 def create_dependency_params_from_pydantic_model(
-    model_class: Type[TypeSchema],
+    model_class: Union[Type[TypeSchema], type],
 ) -> list[Parameter]:
+    """
+    Create endpoint params from dependencies class.
+
+    The class may be a pydantic model or a dataclass, defaults are expected to be FastAPI `Depends`.
+    """
+    if is_dataclass(model_class):
+        type_hints = get_type_hints(model_class, include_extras=True)
+        params = []
+        for field in fields(model_class):
+            if field.default_factory is not MISSING:
+                msg = (
+                    f"Field {field.name!r} of dependencies dataclass {model_class.__name__!r} uses default_factory, "
+                    "it can't be passed to the endpoint signature, use a FastAPI `Depends` default instead"
+                )
+                raise ValueError(msg)
+
+            params.append(
+                Parameter(
+                    name=field.name,
+                    # required fields have no default, keyword only params may follow the endpoint params with defaults
+                    kind=Parameter.KEYWORD_ONLY,
+                    annotation=type_hints[field.name],
+                    default=Parameter.empty if field.default is MISSING else field.default,
+                ),
+            )
+
+        return params
+
     return [
         Parameter(
             name=field_name,
@@ -8,11 +8,20 @@ log = logging.getLogger(__name__)
 
 
 class ModelsStorage:
+    __slots__ = (
+        "_id_field_names",
+        "_models",
+        "_orm_mode",
+        "_relationship_models",
+        "relationship_search_handlers",
+    )
+
     relationship_search_handlers: dict[str, Callable[[str, Type[TypeModel], str], Type[TypeModel]]]
 
     def __init__(self):
         self._models: dict[str, Type[TypeModel]] = {}
         self._id_field_names: dict[str, str] = {}
+        self._relationship_models: dict[tuple[Type[TypeModel], str], Type[TypeModel]] = {}
         self.relationship_search_handlers = {}
 
     def add_model(self, resource_type: str, model: Type[TypeModel], id_field_name: str):
@@ -20,21 +29,21 @@ class ModelsStorage:
         self._id_field_names[resource_type] = id_field_name
 
     def get_model(self, resource_type: str) -> Type[TypeModel]:
-        try:
-            return self._models[resource_type]
-        except KeyError:
+        if (model := self._models.get(resource_type)) is None:
             raise InternalServerError(
                 detail=f"Not found model for resource_type {resource_type!r}.",
             )
 
+        return model
+
     def get_model_id_field_name(self, resource_type: str) -> str:
-        try:
-            return self._id_field_names[resource_type]
-        except KeyError:
+        if (id_field_name := self._id_field_names.get(resource_type)) is None:
             raise InternalServerError(
                 detail=f"Not found model id field name for resource_type {resource_type!r}.",
             )
 
+        return id_field_name
+
     def get_object_id_field(self, resource_type: str) -> Any:
         model = self.get_model(resource_type)
         id_field_name = self.get_model_id_field_name(resource_type)
@@ -47,7 +56,9 @@ class ModelsStorage:
             )
 
     def get_object_id(self, db_object: TypeModel, resource_type: str) -> Any:
-        id_field_name = self.get_model_id_field_name(resource_type)
+        # called for every item in the response, so the id field name lookup is inlined
+        if (id_field_name := self._id_field_names.get(resource_type)) is None:
+            id_field_name = self.get_model_id_field_name(resource_type)
 
         try:
             return getattr(db_object, id_field_name)
@@ -62,6 +73,7 @@ class ModelsStorage:
 
     def set_orm_mode(self, orm_mode: str):
         self._orm_mode = orm_mode
+        self._relationship_models.clear()
 
     def search_relationship_model(
         self,
@@ -69,6 +81,10 @@ class ModelsStorage:
         model: Type[TypeModel],
         field_name: str,
     ) -> Type[TypeModel]:
+        cache_key = (model, field_name)
+        if cache_key in self._relationship_models:
+            return self._relationship_models[cache_key]
+
         try:
             orm_handler = self.relationship_search_handlers[self._orm_mode]
         except KeyError:
@@ -77,7 +93,9 @@ class ModelsStorage:
                 f"Please register this with SchemasStorage.register_search_handler.",
             )
 
-        return orm_handler(resource_type, model, field_name)
+        related_model = orm_handler(resource_type, model, field_name)
+        self._relationship_models[cache_key] = related_model
+        return related_model
 
     @staticmethod
     def sqla_search_relationship_model(
@@ -86,17 +104,21 @@ class ModelsStorage:
         field_name: str,
     ):
         try:
-            return getattr(model, field_name).property.entity.entity
-        except AttributeError:
-            raise BadRequest(
-                detail=f"There is no related model for resource_type {resource_type!r} by relation {field_name!r}.",
-            )
+            mapper = getattr(model, "__mapper__", None)
+            relationship = mapper.relationships.get(field_name) if mapper is not None else None
         except Exception as ex:
             log.error("Relationship search error", exc_info=ex)
             raise InternalServerError(
                 detail=f"Relationship search error for resource_type {resource_type!r} by relation {field_name!r}.",
             )
 
+        if relationship is None:
+            raise BadRequest(
+                detail=f"There is no related model for resource_type {resource_type!r} by relation {field_name!r}.",
+            )
+
+        return relationship.entity.entity
+
 
 models_storage = ModelsStorage()
 models_storage.register_search_handler("sqla", ModelsStorage.sqla_search_relationship_model)
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from sys import intern
 from typing import Any, Literal, Optional, Type
 
 from fastapi_jsonapi.data_typing import TypeSchema
@@ -8,8 +8,18 @@ from fastapi_jsonapi.types_metadata.relationship_info import RelationshipInfo
 
 
 class SchemasStorage:
+    __slots__ = (
+        "_data",
+        "_jsonapi_object_schemas",
+        "_relationships",
+        "_schema_in_keys",
+        "_source_schemas",
+    )
+
     def __init__(self):
-        self._data: dict = {}
+        # flat (resource_type, operation_type) -> schemas, one lookup on the request path
+        self._data: dict[tuple[str, str], dict] = {}
+        self._relationships: dict[tuple[str, str, str, str], Type[TypeSchema]] = {}
         self._source_schemas: dict[str, Type[TypeSchema]] = {}
         self._jsonapi_object_schemas: dict[tuple[Type[TypeSchema], str], JSONAPIObjectSchemas] = {}
         self._schema_in_keys: dict[str, str] = {
@@ -17,12 +27,6 @@ class SchemasStorage:
             "update": "schema_in_update",
         }
 
-    def _init_resource_if_needed(self, resource_type: str):
-        if resource_type not in self._data:
-            self._data[resource_type] = {
-                "relationships": defaultdict(lambda: defaultdict(dict)),
-            }
-
     def add_relationship(
         self,
         from_resource_type: str,
@@ -32,12 +36,8 @@ class SchemasStorage:
         relationship_schema: Type[TypeSchema],
         relationship_info: RelationshipInfo,
     ):
-        self._init_resource_if_needed(from_resource_type)
-        relationships = self._data[from_resource_type]["relationships"][to_resource_type]
-        relationships[(operation_type, field_name)] = {
-            "schema": relationship_schema,
-            "info": relationship_info,
-        }
+        key = (intern(from_resource_type), intern(to_resource_type), intern(operation_type), intern(field_name))
+        self._relationships[key] = relationship_schema
 
     def get_relationship_schema(
         self,
@@ -46,10 +46,7 @@ class SchemasStorage:
         operation_type: Literal["create", "update", "get"],
         field_name: str,
     ) -> Optional[TypeSchema]:
-        self._init_resource_if_needed(from_resource_type)
-
-        relationships = self._data[from_resource_type]["relationships"][to_resource_type]
-        return relationships.get((operation_type, field_name), {}).get("schema")
+        return self._relationships.get((from_resource_type, to_resource_type, operation_type, field_name))
 
     def add_resource(
         self,
@@ -61,22 +58,17 @@ class SchemasStorage:
         attributes_schema: Type[TypeSchema],
         field_schemas: dict[str, Type[TypeSchema]],
         relationships_info: dict[str, tuple[RelationshipInfo, Any]],
-        model_validators: dict,
+        model_validators: tuple[dict, dict],
         schema_in: Optional[Type[TypeSchema]] = None,
     ):
-        self._init_resource_if_needed(resource_type)
-        if operation_type in self._data[resource_type]:
+        if (resource_type, operation_type) in self._data:
             return
 
-        before_validators, after_validators = {}, {}
-        for validator_name, validator in model_validators.items():
-            if validator.decorator_info.mode == "before":
-                before_validators[validator_name] = validator
-            else:
-                after_validators[validator_name] = validator
+        # interned keys let lookups with the same strings short-circuit on identity
+        resource_type, operation_type = intern(resource_type), intern(operation_type)
 
         self._source_schemas[resource_type] = source_schema
-        self._data[resource_type][operation_type] = {
+        self._data[resource_type, operation_type] = {
             "attrs_schema": attributes_schema,
             "field_schemas": field_schemas,
             "data_schema": data_schema,
@@ -86,11 +78,11 @@ class SchemasStorage:
             "relationships_pydantic_fields": {
                 relationship_name: field for relationship_name, (_, field) in relationships_info.items()
             },
-            "model_validators": (before_validators, after_validators),
+            "model_validators": model_validators,
         }
 
         if schema_in:
-            self._data[resource_type][operation_type][self._schema_in_keys[operation_type]] = schema_in
+            self._data[resource_type, operation_type][self._schema_in_keys[operation_type]] = schema_in
 
     def get_source_schema(self, resource_type: str):
         try:
@@ -104,21 +96,28 @@ class SchemasStorage:
         operation_type: Literal["create", "update", "get"],
         field_name: str,
     ):
-        return self._data[resource_type][operation_type]["relationships_pydantic_fields"][field_name]
+        return self._data[resource_type, operation_type]["relationships_pydantic_fields"][field_name]
 
     def get_data_schema(
         self,
         resource_type: str,
         operation_type: Literal["create", "update", "get"],
     ) -> Optional[TypeSchema]:
-        return self._data[resource_type][operation_type]["data_schema"]
+        return self._data[resource_type, operation_type]["data_schema"]
 
     def get_attrs_schema(
         self,
         resource_type: str,
         operation_type: Literal["create", "update", "get"],
     ) -> Optional[TypeSchema]:
-        return self._data[resource_type][operation_type]["attrs_schema"]
+        return self._data[resource_type, operation_type]["attrs_schema"]
+
+    def get_field_schemas(
+        self,
+        resource_type: str,
+        operation_type: Literal["create", "update", "get"],
+    ) -> dict[str, Type[TypeSchema]]:
+        return self._data[resource_type, operation_type]["field_schemas"]
 
     def get_field_schema(
         self,
@@ -126,7 +125,7 @@ class SchemasStorage:
         operation_type: Literal["create", "update", "get"],
         field_name: str,
     ) -> Optional[TypeSchema]:
-        return self._data[resource_type][operation_type]["field_schemas"].get(field_name)
+        return self._data[resource_type, operation_type]["field_schemas"].get(field_name)
 
     def get_schema_in(
         self,
@@ -134,7 +133,7 @@ class SchemasStorage:
         operation_type: Literal["create", "update"],
     ) -> Type[TypeSchema]:
         try:
-            return self._data[resource_type][operation_type][self._schema_in_keys[operation_type]]
+            return self._data[resource_type, operation_type][self._schema_in_keys[operation_type]]
         except KeyError:
             raise InternalServerError(
                 detail=f"Not found schema for operation {operation_type!r} with resource type {resource_type!r}",
@@ -145,7 +144,7 @@ class SchemasStorage:
         resource_type: str,
         operation_type: Literal["create", "update", "get"],
     ) -> tuple[dict, dict]:
-        return self._data[resource_type][operation_type]["model_validators"]
+        return self._data[resource_type, operation_type]["model_validators"]
 
     def get_relationship_info(
         self,
@@ -153,14 +152,14 @@ class SchemasStorage:
         operation_type: Literal["create", "update", "get"],
         field_name: str,
     ) -> Optional[RelationshipInfo]:
-        return self._data[resource_type][operation_type]["relationships_info"].get(field_name)
+        return self._data[resource_type, operation_type]["relationships_info"].get(field_name)
 
     def get_relationships_info(
         self,
         resource_type: str,
         operation_type: Literal["create", "update", "get"],
     ) -> dict[str, RelationshipInfo]:
-        return self._data[resource_type][operation_type]["relationships_info"]
+        return self._data[resource_type, operation_type]["relationships_info"]
 
     def get_jsonapi_object_schema(
         self,
@@ -185,7 +184,7 @@ class SchemasStorage:
         resource_type: str,
         operation_type: Literal["create", "update", "get"],
     ) -> bool:
-        return self.has_resource(resource_type) and operation_type in self._data[resource_type]
+        return (resource_type, operation_type) in self._data
 
 
 schemas_storage = SchemasStorage()
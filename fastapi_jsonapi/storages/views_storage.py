@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class ViewStorage:
+    __slots__ = ("_views",)
+
     def __init__(self):
         self._views: dict[str, Type[ViewBase]] = {}
 
@@ -19,6 +19,10 @@ log = logging.getLogger(__name__)
 ColumnType = TypeVar("ColumnType")
 ExpressionType = TypeVar("ExpressionType")
 
+# resolved once instead of per filter expression
+_lower = func.lower
+_jsonb_type = JSONB_SQLA()
+
 
 @dataclass(frozen=True)
 class CustomFilterSQL(Generic[ColumnType, ExpressionType]):
@@ -45,7 +49,7 @@ def _get_pg_jsonb_contains_expression(
     with contextlib.suppress(ValueError):
         value = json.loads(value)
 
-    return model_column.cast(JSONB_SQLA).op("@>")(value)
+    return model_column.cast(_jsonb_type).op("@>")(value)
 
 
 def _get_sqlite_json_contains_expression(
@@ -70,7 +74,7 @@ def _get_pg_jsonb_ilike_expression(
         raise InvalidFilters(msg)
 
     if isinstance(regex, (list, dict)):
-        return model_column[target_field].cast(JSONB_SQLA).op("@>")(regex)
+        return model_column[target_field].cast(_jsonb_type).op("@>")(regex)
     elif isinstance(regex, bool):
         regex = f"{regex}".lower()
     else:
@@ -110,7 +114,7 @@ class LowerEqualsFilterSQL(CustomFilterSQLA):
     ) -> BinaryExpression:
         return cast(
             BinaryExpression,
-            func.lower(model_column) == func.lower(value),
+            _lower(model_column) == _lower(value),
         )
 
 
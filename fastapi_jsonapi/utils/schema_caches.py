@@ -0,0 +1,28 @@
+"""Caches of data derived from schema classes."""
+
+from functools import cache
+from typing import Callable, TypeVar
+
+CachedFunc = TypeVar("CachedFunc", bound=Callable)
+
+_schema_caches: list[Callable] = []
+
+
+def schema_cache(func: CachedFunc) -> CachedFunc:
+    """
+    `functools.cache` for functions of schema classes, cleared by `clear_schema_caches`.
+    """
+    cached_func = cache(func)
+    _schema_caches.append(cached_func)
+    return cached_func
+
+
+def clear_schema_caches() -> None:
+    """
+    Drop the data derived from schema classes.
+
+    Results computed before a schema was rebuilt (e.g. forward refs resolved by `model_rebuild`)
+    are not reused, dynamically created schema classes are not kept alive by the caches.
+    """
+    for cached_func in _schema_caches:
+        cached_func.cache_clear()
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, TypeAdapter, field_validator, model_validator
 from pydantic._internal._decorators import PydanticDescriptorProxy
 
+from fastapi_jsonapi.utils.schema_caches import schema_cache
+
 if TYPE_CHECKING:
     # noinspection PyProtectedMember
     from pydantic._internal._decorators import DecoratorInfos
 
 
+def get_type_adapter(type_: Any) -> TypeAdapter:
+    """
+    Return TypeAdapter for the type, building its core schema only once per hashable type.
+
+    :raises PydanticSchemaGenerationError: if pydantic can't build schema for the type.
+    """
+    try:
+        return _get_type_adapter(type_)
+    except TypeError:
+        # unhashable annotation, e.g. Annotated with dict metadata
+        return _get_type_adapter.__wrapped__(type_)
+
+
+@schema_cache
+def _get_type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
 def extract_validators(
     model: Type[BaseModel],
     include_for_field_names: Optional[set[str]] = None,
@@ -41,11 +61,26 @@ def extract_validators(
             field_validators[name] = validator_config(func)
 
     # model validators
-    for name, validator in validators.model_validators.items():
-        validator_config = model_validator(mode=validator.info.mode)
+    before_validators, after_validators = get_model_validators(model)
+    model_validators.update(before_validators)
+    model_validators.update(after_validators)
 
-        func = validator.func.__func__ if hasattr(validator.func, "__func__") else validator.func
+    return field_validators, model_validators
 
-        model_validators[name] = validator_config(func)
 
-    return field_validators, model_validators
+@schema_cache
+def get_model_validators(
+    model: Type[BaseModel],
+) -> tuple[dict[str, PydanticDescriptorProxy], dict[str, PydanticDescriptorProxy]]:
+    """
+    Return model validators split into (before, after), the split depends only on the model class.
+
+    :param model: pydantic model to extract validators from.
+    """
+    before_validators, after_validators = {}, {}
+    for name, validator in model.__pydantic_decorators__.model_validators.items():
+        func = validator.func.__func__ if hasattr(validator.func, "__func__") else validator.func
+        target = before_validators if validator.info.mode == "before" else after_validators
+        target[name] = model_validator(mode=validator.info.mode)(func)
+
+    return before_validators, after_validators
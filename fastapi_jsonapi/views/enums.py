@@ -14,19 +14,23 @@ class Operation(str, Enum):
 
     @staticmethod
     def real_operations() -> list[Operation]:
-        return list(filter(lambda op: op != Operation.ALL, Operation))
+        return list(_REAL_OPERATIONS)
 
     def http_method(self) -> str:
         if self == Operation.ALL:
             msg = "HTTP method is not defined for 'ALL' operation."
             raise Exception(msg)
 
-        operation_to_http_method = {
-            Operation.GET: "GET",
-            Operation.GET_LIST: "GET",
-            Operation.UPDATE: "PATCH",
-            Operation.CREATE: "POST",
-            Operation.DELETE: "DELETE",
-            Operation.DELETE_LIST: "DELETE",
-        }
-        return operation_to_http_method[self]
+        return _OPERATION_TO_HTTP_METHOD[self]
+
+
+# members are fixed at class creation, build the lookups once
+_REAL_OPERATIONS: tuple[Operation, ...] = tuple(op for op in Operation if op != Operation.ALL)
+_OPERATION_TO_HTTP_METHOD: dict[Operation, str] = {
+    Operation.GET: "GET",
+    Operation.GET_LIST: "GET",
+    Operation.UPDATE: "PATCH",
+    Operation.CREATE: "POST",
+    Operation.DELETE: "DELETE",
+    Operation.DELETE_LIST: "DELETE",
+}
@@ -1,6 +1,7 @@
-from typing import Callable, Coroutine, Optional, Type, Union
+import inspect
+from typing import Callable, Coroutine, Optional, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
 class OperationConfig(BaseModel):
@@ -8,13 +9,31 @@ class OperationConfig(BaseModel):
         arbitrary_types_allowed=True,
     )
 
-    dependencies: Optional[Type[BaseModel]] = None
+    # pydantic model or dataclass with FastAPI dependencies as defaults
+    dependencies: Optional[type] = None
     prepare_data_layer_kwargs: Optional[Union[Callable, Coroutine]] = None
+    # call a sync handler in the event loop instead of the threadpool, only for non-blocking handlers
+    run_inline: bool = False
+
+    # set by EndpointsBuilder on the merged operation config which runs the common handler
+    _includes_common_handler: bool = PrivateAttr(default=False)
+    # handler the check was done for and the result
+    _async_handler_check: tuple[Optional[Callable], bool] = PrivateAttr(default=(None, False))
 
     @property
     def handler(self) -> Optional[Union[Callable, Coroutine]]:
         return self.prepare_data_layer_kwargs
 
+    @property
+    def is_async_handler(self) -> bool:
+        # inspected once per handler, the check is repeated only if the handler was replaced
+        checked_handler, is_async = self._async_handler_check
+        if checked_handler is not self.handler:
+            is_async = inspect.iscoroutinefunction(self.handler)
+            self._async_handler_check = (self.handler, is_async)
+
+        return is_async
+
 
 class RelationshipRequestInfo(BaseModel):
     parent_obj_id: str
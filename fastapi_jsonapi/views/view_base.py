@@ -1,34 +1,94 @@
-import inspect
 import logging
+from copy import deepcopy
+from dataclasses import fields, is_dataclass
 from functools import partial
-from typing import Any, Callable, ClassVar, Iterable, Optional, Type
+from operator import attrgetter
+from typing import Any, ClassVar, Optional, Type
 
 from fastapi import Request
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel as PydanticBaseModel
 
-from fastapi_jsonapi.common import get_relationship_info_from_field_metadata
 from fastapi_jsonapi.data_layers.base import BaseDataLayer
 from fastapi_jsonapi.data_typing import TypeModel, TypeSchema
 from fastapi_jsonapi.exceptions import BadRequest
 from fastapi_jsonapi.querystring import QueryStringManager
-from fastapi_jsonapi.schema import BaseJSONAPIItemInSchema
+from fastapi_jsonapi.schema import BaseJSONAPIItemInSchema, get_relationship_fields_names
 from fastapi_jsonapi.schema_base import BaseModel
 from fastapi_jsonapi.storages.models_storage import models_storage
 from fastapi_jsonapi.storages.schemas_storage import schemas_storage
 from fastapi_jsonapi.types_metadata import RelationshipInfo
+from fastapi_jsonapi.utils.schema_caches import schema_cache
 from fastapi_jsonapi.views import Operation, OperationConfig, RelationshipRequestInfo
 
 logger = logging.getLogger(__name__)
 
+# shared by all responses, treat as read-only
+_JSONAPI_VERSION = {"version": "1.0"}
+
+
+@schema_cache
+def _get_attribute_names(schema: Type[TypeSchema]) -> frozenset[str]:
+    """Schema classes don't change after creation, names are collected once per class."""
+    return frozenset(schema.model_fields).difference(get_relationship_fields_names(schema))
+
+
+@schema_cache
+def _get_item_template(data_schema: Type[TypeSchema]) -> Optional[tuple[dict[str, Any], tuple[str, ...]]]:
+    """
+    Serialized jsonapi object with placeholder id and attributes, keys are in the schema fields order.
+
+    Returns the template and names of the non-scalar values which have to be copied for each item,
+    or None if the schema has validators, serializers or computed fields and the item has to be built by the schema.
+    """
+    decorators = data_schema.__pydantic_decorators__
+    if any(
+        (
+            decorators.validators,
+            decorators.field_validators,
+            decorators.root_validators,
+            decorators.field_serializers,
+            decorators.model_serializers,
+            decorators.model_validators,
+            decorators.computed_fields,
+        ),
+    ):
+        return None
+
+    # attributes placeholder isn't an attributes schema instance, it's not dumped to avoid serializer warnings
+    defaults = data_schema.model_construct(id="", attributes={}).model_dump(exclude={"attributes"})
+    template = {
+        field_name: defaults.get(field_name)
+        for field_name in data_schema.model_fields
+        if field_name in defaults or field_name == "attributes"
+    }
+    copy_keys = tuple(
+        key
+        for key, value in template.items()
+        if key not in {"id", "attributes"} and not isinstance(value, (str, int, float, bool, type(None)))
+    )
+    return template, copy_keys
+
 
 class ViewBase:
     """
     Views are inited for each request
     """
 
+    __slots__ = (
+        "model",
+        "operation",
+        "operation_configs",
+        "options",
+        "query_params",
+        "request",
+        "resource_type",
+        "schema",
+    )
+
     data_layer_cls = BaseDataLayer
     operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {}
+    # build response objects from db items without validating the jsonapi envelope twice
+    trusted_construct: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -38,6 +98,7 @@ class ViewBase:
         operation: Operation,
         model: Type[TypeModel],
         schema: Type[TypeSchema],
+        operation_configs: Optional[tuple[OperationConfig, ...]] = None,
         **options,
     ):
         self.request: Request = request
@@ -46,8 +107,15 @@ class ViewBase:
         self.operation: Operation = operation
         self.model: Type[TypeModel] = model
         self.schema: Type[TypeSchema] = schema
+        # resolved by EndpointsBuilder, views created without it (e.g. for atomic operations) resolve them here
+        if operation_configs is None:
+            operation_configs = self.get_operation_configs(operation)
+        self.operation_configs: tuple[OperationConfig, ...] = operation_configs
         self.options: dict = options
-        self.query_params: QueryStringManager = QueryStringManager(request=request)
+        # parsed once per request, shared with middlewares and other views handling the same request
+        if (query_params := getattr(request.state, "jsonapi_query_params", None)) is None:
+            query_params = request.state.jsonapi_query_params = QueryStringManager(request=request)
+        self.query_params: QueryStringManager = query_params
 
     async def get_data_layer(
         self,
@@ -202,14 +270,17 @@ class ViewBase:
 
     async def _run_handler(
         self,
-        handler: Callable,
+        config: OperationConfig,
         dto: Optional[BaseModel] = None,
     ):
-        handler = partial(handler, self, dto) if dto is not None else partial(handler, self)
+        handler = partial(config.handler, self, dto) if dto is not None else partial(config.handler, self)
 
-        if inspect.iscoroutinefunction(handler):
+        if config.is_async_handler:
             return await handler()
 
+        if config.run_inline:
+            return handler()
+
         return await run_in_threadpool(handler)
 
     async def _handle_config(
@@ -221,11 +292,19 @@ class ViewBase:
             return {}
 
         if config.dependencies:
-            dto_class: Type[PydanticBaseModel] = config.dependencies
+            dto_class: type = config.dependencies
+            if is_dataclass(dto_class):
+                # unlike pydantic models dataclasses don't ignore extra kwargs
+                extra_view_deps = {
+                    field.name: extra_view_deps[field.name]
+                    for field in fields(dto_class)
+                    if field.name in extra_view_deps
+                }
+
             dto = dto_class(**extra_view_deps)
-            return await self._run_handler(config.handler, dto)
+            return await self._run_handler(config, dto)
 
-        return await self._run_handler(config.handler)
+        return await self._run_handler(config)
 
     async def handle_endpoint_dependencies(
         self,
@@ -235,14 +314,32 @@ class ViewBase:
         :return dict: this is **kwargs for DataLayer.__init___
         """
         dl_kwargs = {}
-        if common_method_config := self.operation_dependencies.get(Operation.ALL):
-            dl_kwargs.update(await self._handle_config(common_method_config, extra_view_deps))
-
-        if method_config := self.operation_dependencies.get(self.operation):
-            dl_kwargs.update(await self._handle_config(method_config, extra_view_deps))
+        for config in self.operation_configs:
+            dl_kwargs.update(await self._handle_config(config, extra_view_deps))
 
         return dl_kwargs
 
+    @classmethod
+    def get_operation_configs(cls, operation: Operation) -> tuple[OperationConfig, ...]:
+        """
+        Configs with handlers to run for the operation.
+
+        The operation config merged by EndpointsBuilder may run the common handler itself,
+        in this case the common config is skipped, so the handler is not run twice.
+        """
+        common_config = cls.operation_dependencies.get(Operation.ALL)
+        method_config = cls.operation_dependencies.get(operation)
+
+        configs = []
+        common_handler_included = method_config is not None and method_config._includes_common_handler
+        if common_config and common_config.handler and not common_handler_included:
+            configs.append(common_config)
+
+        if method_config and method_config.handler:
+            configs.append(method_config)
+
+        return tuple(configs)
+
     def _calculate_total_pages(self, db_items_count: int) -> int:
         total_pages = 1
         if not (pagination_size := self.query_params.pagination.size):
@@ -254,29 +351,48 @@ class ViewBase:
             and 1
         )
 
+    @classmethod
+    def _get_item_schemas(cls, resource_type: str) -> tuple[Type[TypeSchema], Type[TypeSchema]]:
+        """Attributes and data schemas used to serialize items of the resource type."""
+        return (
+            schemas_storage.get_attrs_schema(resource_type, operation_type="get"),
+            schemas_storage.get_data_schema(resource_type, operation_type="get"),
+        )
+
     @classmethod
     def _prepare_item_data(
         cls,
         db_item,
         resource_type: str,
         include_fields: Optional[dict[str, dict[str, Type[TypeSchema]]]] = None,
+        item_schemas: Optional[tuple[Type[TypeSchema], Type[TypeSchema]]] = None,
     ) -> dict:
-        attrs_schema = schemas_storage.get_attrs_schema(resource_type, operation_type="get")
+        attrs_schema, data_schema = item_schemas or cls._get_item_schemas(resource_type)
 
         if include_fields is None or not (field_schemas := include_fields.get(resource_type)):
+            # attributes are always validated, user validators may change the output values
+            attributes = attrs_schema.model_validate(db_item)
+
+            if cls.trusted_construct and (item_template := _get_item_template(data_schema)) is not None:
+                template, copy_keys = item_template
+                item = dict(template)
+                item["id"] = f"{db_item.id}"
+                item["attributes"] = attributes.model_dump()
+                # items must not share nested defaults, they may be changed in place later
+                for key in copy_keys:
+                    item[key] = deepcopy(item[key])
 
-            data_schema = schemas_storage.get_data_schema(resource_type, operation_type="get")
-            return data_schema(
-                id=f"{db_item.id}",
-                attributes=attrs_schema.model_validate(db_item),
-            ).model_dump()
+                return item
+
+            return data_schema(id=f"{db_item.id}", attributes=attributes).model_dump()
 
         result_attributes = {}
         # empty str means skip all attributes
         if "" not in field_schemas:
-            pre_values = {}
-            for field_name, field_schema in field_schemas.items():
-                pre_values[field_name] = getattr(db_item, field_name)
+            # attrgetter reads all requested attributes in one C level call
+            field_names = tuple(field_schemas)
+            values = attrgetter(*field_names)(db_item)
+            pre_values = dict(zip(field_names, values)) if len(field_names) > 1 else {field_names[0]: values}
 
             before_validators, after_validators = schemas_storage.get_model_validators(
                 resource_type,
@@ -309,95 +425,110 @@ class ViewBase:
             "attributes": result_attributes,
         }
 
-    def _prepare_include_params(self) -> list[list[str]]:
-        result = []
-        includes = sorted(self.query_params.include)
-        prev, *_ = includes
-
-        for include in includes:
-            if not include.startswith(prev):
-                result.append(prev.split("."))
+    def _prepare_include_params(self) -> dict[str, dict]:
+        """Build include tree, e.g. `a.b,a.c,d` -> {"a": {"b": {}, "c": {}}, "d": {}}"""
+        include_tree: dict[str, dict] = {}
+        for include in self.query_params.include:
+            node = include_tree
+            for relationship_name in include.split("."):
+                node = node.setdefault(relationship_name, {})
 
-            prev = include
-
-        result.append(prev.split("."))
-        return result
-
-    @classmethod
-    def _get_include_key(cls, db_item: TypeModel, info: RelationshipInfo) -> tuple[str, str]:
-        return info.resource_type, str(getattr(db_item, info.id_field_name))
+        return include_tree
 
     def _process_includes(
         self,
         db_items: list[TypeModel],
         items_data: list[dict],
         resource_type: str,
-        include_paths: list[Iterable[str]],
+        include_tree: dict[str, dict],
         include_fields: dict[str, dict[str, Type[TypeSchema]]],
-        result_included: Optional[dict] = None,
-    ) -> dict[tuple[str, str], dict]:
-        result_included = result_included or {}
+        result_included: Optional[dict[str, dict[str, dict]]] = None,
+    ) -> dict[str, dict[str, dict]]:
+        """Returns included items grouped by resource type, then by id"""
+        if result_included is None:
+            result_included = {}
+
+        # same for every item, resolved before the items loop;
+        # relationships are eager loaded by the data layer (`eagerload_includes`), so access here does no IO
+        relationships_to_process: list[tuple] = []
+        for target_relationship, nested_include_tree in include_tree.items():
+            info: RelationshipInfo = schemas_storage.get_relationship_info(
+                resource_type=resource_type,
+                operation_type="get",
+                field_name=target_relationship,
+            )
+            item_schemas = self._get_item_schemas(info.resource_type)
+            relationships_to_process.append(
+                (
+                    target_relationship,
+                    info,
+                    item_schemas,
+                    nested_include_tree,
+                    attrgetter(target_relationship),
+                    attrgetter(info.id_field_name),
+                    result_included.setdefault(info.resource_type, {}),
+                ),
+            )
 
         for db_item, item_data in zip(db_items, items_data):
             item_data["relationships"] = item_data.get("relationships", {})
 
-            for path in include_paths:
-                target_relationship, *include_path = path
-                info: RelationshipInfo = schemas_storage.get_relationship_info(
-                    resource_type=resource_type,
-                    operation_type="get",
-                    field_name=target_relationship,
-                )
+            for (
+                target_relationship,
+                info,
+                item_schemas,
+                nested_include_tree,
+                get_related,
+                get_related_id,
+                included_by_id,
+            ) in relationships_to_process:
+                related_resource_type = info.resource_type
                 db_items_to_process: list[TypeModel] = []
                 items_data_to_process: list[dict] = []
 
                 if info.many:
                     relationship_data = []
 
-                    for relationship_db_item in getattr(db_item, target_relationship):
-                        include_key = self._get_include_key(relationship_db_item, info)
+                    for relationship_db_item in get_related(db_item):
+                        related_id = str(get_related_id(relationship_db_item))
 
-                        if not (relationship_item_data := result_included.get(include_key)):
+                        if not (relationship_item_data := included_by_id.get(related_id)):
                             relationship_item_data = self._prepare_item_data(
                                 db_item=relationship_db_item,
-                                resource_type=info.resource_type,
+                                resource_type=related_resource_type,
                                 include_fields=include_fields,
+                                item_schemas=item_schemas,
                             )
-                            result_included[include_key] = relationship_item_data
+                            included_by_id[related_id] = relationship_item_data
 
                         db_items_to_process.append(relationship_db_item)
-                        relationship_data.append(
-                            {
-                                "id": str(getattr(relationship_db_item, info.id_field_name)),
-                                "type": info.resource_type,
-                            },
-                        )
+                        relationship_data.append({"id": related_id, "type": related_resource_type})
                         items_data_to_process.append(relationship_item_data)
                 else:
-                    if (relationship_db_item := getattr(db_item, target_relationship)) is None:
+                    if (relationship_db_item := get_related(db_item)) is None:
                         item_data["relationships"][target_relationship] = {"data": None}
                         continue
 
                     db_items_to_process.append(relationship_db_item)
-                    relationship_data = {
-                        "id": str(getattr(relationship_db_item, info.id_field_name)),
-                        "type": info.resource_type,
-                    }
-
-                    include_key = self._get_include_key(relationship_db_item, info)
-
-                    if not (relationship_item_data := result_included.get(include_key)):
-                        relationship_item_data = self._prepare_item_data(relationship_db_item, info.resource_type)
-                        result_included[include_key] = relationship_item_data
+                    related_id = str(get_related_id(relationship_db_item))
+                    relationship_data = {"id": related_id, "type": related_resource_type}
+
+                    if not (relationship_item_data := included_by_id.get(related_id)):
+                        relationship_item_data = self._prepare_item_data(
+                            db_item=relationship_db_item,
+                            resource_type=related_resource_type,
+                            item_schemas=item_schemas,
+                        )
+                        included_by_id[related_id] = relationship_item_data
 
                     items_data_to_process.append(relationship_item_data)
 
-                if include_path:
+                if nested_include_tree:
                     self._process_includes(
                         db_items=db_items_to_process,
                         items_data=items_data_to_process,
                         resource_type=info.resource_type,
-                        include_paths=[include_path],
+                        include_tree=nested_include_tree,
                         result_included=result_included,
                         include_fields=include_fields,
                     )
@@ -407,38 +538,34 @@ class ViewBase:
         return result_included
 
     @classmethod
-    def _get_schema_field_names(cls, schema: type[TypeSchema]) -> set[str]:
+    def _get_schema_field_names(cls, schema: type[TypeSchema]) -> frozenset[str]:
         """Returns all attribute names except relationships"""
-        result = set()
-
-        for field_name, field in schema.model_fields.items():
-            if get_relationship_info_from_field_metadata(field):
-                continue
-
-            result.add(field_name)
-
-        return result
+        return _get_attribute_names(schema)
 
     def _get_include_fields(self) -> dict[str, dict[str, Type[TypeSchema]]]:
         include_fields = {}
         for resource_type, field_names in self.query_params.fields.items():
-            include_fields[resource_type] = {}
-
-            for field_name in field_names:
-                include_fields[resource_type][field_name] = schemas_storage.get_field_schema(
-                    resource_type=resource_type,
-                    operation_type="get",
-                    field_name=field_name,
-                )
+            # built at registration, one storage lookup per resource type
+            field_schemas = schemas_storage.get_field_schemas(resource_type=resource_type, operation_type="get")
+            include_fields[resource_type] = {field_name: field_schemas.get(field_name) for field_name in field_names}
 
         return include_fields
 
+    @classmethod
+    def _sort_included(cls, included: dict[str, dict[str, dict]]) -> list[dict]:
+        # ordered by type, then by id
+        return [
+            included_by_id[item_id]
+            for _, included_by_id in sorted(included.items())
+            for item_id in sorted(included_by_id)
+        ]
+
     def _build_detail_response(self, db_item: TypeModel) -> dict:
         include_fields = self._get_include_fields()
         item_data = self._prepare_item_data(db_item, self.resource_type, include_fields)
         response = {
             "data": item_data,
-            "jsonapi": {"version": "1.0"},
+            "jsonapi": _JSONAPI_VERSION,
             "meta": None,
         }
 
@@ -446,11 +573,11 @@ class ViewBase:
             included = self._process_includes(
                 db_items=[db_item],
                 items_data=[item_data],
-                include_paths=self._prepare_include_params(),
+                include_tree=self._prepare_include_params(),
                 resource_type=self.resource_type,
                 include_fields=include_fields,
             )
-            response["included"] = [value for _, value in sorted(included.items(), key=lambda item: item[0])]
+            response["included"] = self._sort_included(included)
 
         return response
 
@@ -461,12 +588,15 @@ class ViewBase:
         total_pages: int,
     ) -> dict:
         include_fields = self._get_include_fields()
+        resource_type = self.resource_type
+        item_schemas = self._get_item_schemas(resource_type)
+        prepare_item_data = self._prepare_item_data
         items_data = [
-            self._prepare_item_data(db_item, self.resource_type, include_fields) for db_item in items_from_db
+            prepare_item_data(db_item, resource_type, include_fields, item_schemas) for db_item in items_from_db
         ]
         response = {
             "data": items_data,
-            "jsonapi": {"version": "1.0"},
+            "jsonapi": _JSONAPI_VERSION,
             "meta": {"count": count, "totalPages": total_pages},
         }
 
@@ -475,9 +605,9 @@ class ViewBase:
                 db_items=items_from_db,
                 items_data=items_data,
                 resource_type=self.resource_type,
-                include_paths=self._prepare_include_params(),
+                include_tree=self._prepare_include_params(),
                 include_fields=include_fields,
             )
-            response["included"] = [value for _, value in sorted(included.items(), key=lambda item: item[0])]
+            response["included"] = self._sort_included(included)
 
         return response
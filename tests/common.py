@@ -1,3 +1,4 @@
+from functools import cache
 from os import getenv
 from pathlib import Path
 
@@ -5,6 +6,8 @@ from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
 
+# the environment is fixed for the test run, also checked by the connect listener on every new connection
+@cache
 def sqla_uri():
     testing_db_url = getenv("TESTING_DB_URL")
     if not testing_db_url:
@@ -13,10 +16,12 @@ def sqla_uri():
     return testing_db_url
 
 
+@cache
 def is_postgres_tests() -> bool:
     return "postgres" in sqla_uri()
 
 
+@cache
 def is_sqlite_tests() -> bool:
     return "sqlite" in sqla_uri()
 
@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from collections import defaultdict
-from copy import copy
 
 import pytest
 from fastapi import FastAPI
@@ -11,6 +10,7 @@ from pytest_asyncio import fixture as async_fixture
 
 from fastapi_jsonapi.atomic.prepared_atomic_operation import atomic_dependency_handlers
 from fastapi_jsonapi.data_layers.sqla.query_building import relationships_info_storage
+from fastapi_jsonapi.utils.schema_caches import clear_schema_caches
 from tests.fixtures.app import (  # noqa
     app,
     app_plain,
@@ -21,6 +21,7 @@ from tests.fixtures.db_connection import (  # noqa
     refresh_db,
 )
 from tests.fixtures.entities import (  # noqa
+    association_factory,
     child_1,
     child_2,
     child_3,
@@ -28,11 +29,7 @@ from tests.fixtures.entities import (  # noqa
     computer_1,
     computer_2,
     computer_factory,
-    p1_c1_association,
-    p1_c2_association,
-    p2_c1_association,
-    p2_c2_association,
-    p2_c3_association,
+    computers_factory,
     parent_1,
     parent_2,
     parent_3,
@@ -82,18 +79,27 @@ def event_loop():
     loop.close()
 
 
-@async_fixture()
+@async_fixture(scope="session")
 async def client(app: FastAPI) -> AsyncClient:  # noqa
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_caches_after_test():
+    yield
+    # schemas created by a test are released
+    clear_schema_caches()
+
+
 @pytest.fixture
 def clear_relationships_info_storage():
-    data = copy(relationships_info_storage._data)
+    data = relationships_info_storage._data
     relationships_info_storage._data = defaultdict(dict)
-    yield
-    relationships_info_storage._data = data
+    try:
+        yield
+    finally:
+        relationships_info_storage._data = data
 
 
 @pytest.fixture(autouse=True)
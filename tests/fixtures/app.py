@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 from typing import Optional, Type
 
@@ -211,6 +212,8 @@ def build_app_custom(
     return app
 
 
+# resources are registered in the global storages, only a fixed app shape is safe to reuse
+@cache
 def build_alphabet_app() -> FastAPI:
     return build_custom_app_by_schemas(
         [
@@ -2,6 +2,7 @@ from typing import Awaitable, Callable, Optional
 
 import pytest
 from pytest_asyncio import fixture as async_fixture
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from examples.api_for_sqlalchemy.models import (
@@ -68,10 +69,7 @@ async def user_1(async_session: AsyncSession):
     async_session.add(user)
     await async_session.commit()
 
-    yield user
-
-    await async_session.delete(user)
-    await async_session.commit()
+    return user
 
 
 @async_fixture()
@@ -80,10 +78,7 @@ async def user_2(async_session: AsyncSession):
     async_session.add(user)
     await async_session.commit()
 
-    yield user
-
-    await async_session.delete(user)
-    await async_session.commit()
+    return user
 
 
 @async_fixture()
@@ -92,10 +87,7 @@ async def user_3(async_session: AsyncSession):
     async_session.add(user)
     await async_session.commit()
 
-    yield user
-
-    await async_session.delete(user)
-    await async_session.commit()
+    return user
 
 
 @async_fixture()
@@ -134,19 +126,25 @@ async def create_post(async_session: AsyncSession, user: User, **fields) -> Post
     return post
 
 
+async def bulk_create(async_session: AsyncSession, model: type, rows: list[dict]) -> list:
+    # one multi-row INSERT ... RETURNING instead of an INSERT per row on flush
+    result = await async_session.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows)
+    objects = result.all()
+    await async_session.commit()
+    return objects
+
+
 @async_fixture()
 async def user_1_posts(async_session: AsyncSession, user_1: User) -> list[Post]:
-    posts = [
-        Post(
-            title=f"post_u1_{i}",
-            user=user_1,
-            body=fake.sentence(),
-        )
+    rows = [
+        {
+            "title": f"post_u1_{i}",
+            "user_id": user_1.id,
+            "body": fake.sentence(),
+        }
         for i in range(1, 4)
     ]
-    async_session.add_all(posts)
-    await async_session.commit()
-    return posts
+    return await bulk_create(async_session, Post, rows)
 
 
 @async_fixture()
@@ -158,45 +156,33 @@ async def user_1_post(async_session: AsyncSession, user_1: User):
     async_session.add(post)
     await async_session.commit()
 
-    yield post
-
-    await async_session.delete(post)
-    await async_session.commit()
+    return post
 
 
 @async_fixture()
 async def user_2_posts(async_session: AsyncSession, user_2: User) -> list[Post]:
-    posts = [
-        Post(
-            title=f"post_u2_{i}",
-            user=user_2,
-            body=fake.sentence(),
-        )
+    rows = [
+        {
+            "title": f"post_u2_{i}",
+            "user_id": user_2.id,
+            "body": fake.sentence(),
+        }
         for i in range(1, 5)
     ]
-    async_session.add_all(posts)
-    await async_session.commit()
-    return posts
+    return await bulk_create(async_session, Post, rows)
 
 
 @async_fixture()
 async def user_1_comments_for_u2_posts(async_session: AsyncSession, user_1, user_2_posts):
-    post_comments = [
-        PostComment(
-            text=f"comment_{i}_for_post_{post.id}",
-            post=post,
-            user=user_1,
-        )
+    rows = [
+        {
+            "text": f"comment_{i}_for_post_{post.id}",
+            "post_id": post.id,
+            "user_id": user_1.id,
+        }
         for i, post in enumerate(user_2_posts, start=1)
     ]
-    async_session.add_all(post_comments)
-    await async_session.commit()
-
-    yield post_comments
-
-    for comment in post_comments:
-        await async_session.delete(comment)
-    await async_session.commit()
+    return await bulk_create(async_session, PostComment, rows)
 
 
 @pytest.fixture
@@ -212,10 +198,7 @@ async def computer_1(async_session: AsyncSession):
     async_session.add(computer)
     await async_session.commit()
 
-    yield computer
-
-    await async_session.delete(computer)
-    await async_session.commit()
+    return computer
 
 
 @async_fixture()
@@ -226,10 +209,7 @@ async def computer_2(async_session: AsyncSession):
     async_session.add(computer)
     await async_session.commit()
 
-    yield computer
-
-    await async_session.delete(computer)
-    await async_session.commit()
+    return computer
 
 
 @async_fixture()
@@ -243,6 +223,17 @@ async def computer_factory(async_session: AsyncSession) -> Callable[[Optional[st
     return factory
 
 
+@async_fixture()
+async def computers_factory(async_session: AsyncSession) -> Callable[[int], Awaitable[list[Computer]]]:
+    async def factory(count: int) -> list[Computer]:
+        computers = [build_computer() for _ in range(count)]
+        async_session.add_all(computers)
+        await async_session.commit()
+        return computers
+
+    return factory
+
+
 def build_post_comment(user: User, post: Post, **fields) -> PostComment:
     fields = {
         "text": fake.sentence(),
@@ -277,10 +268,7 @@ async def user_2_comment_for_one_u1_post(async_session: AsyncSession, user_2, us
     async_session.add(post_comment)
     await async_session.commit()
 
-    yield post_comment
-
-    await async_session.delete(post_comment)
-    await async_session.commit()
+    return post_comment
 
 
 @async_fixture()
@@ -291,10 +279,7 @@ async def parent_1(async_session: AsyncSession):
     async_session.add(parent)
     await async_session.commit()
 
-    yield parent
-
-    await async_session.delete(parent)
-    await async_session.commit()
+    return parent
 
 
 @async_fixture()
@@ -305,10 +290,7 @@ async def parent_2(async_session: AsyncSession):
     async_session.add(parent)
     await async_session.commit()
 
-    yield parent
-
-    await async_session.delete(parent)
-    await async_session.commit()
+    return parent
 
 
 @async_fixture()
@@ -319,10 +301,7 @@ async def parent_3(async_session: AsyncSession):
     async_session.add(parent)
     await async_session.commit()
 
-    yield parent
-
-    await async_session.delete(parent)
-    await async_session.commit()
+    return parent
 
 
 @async_fixture()
@@ -333,10 +312,7 @@ async def child_1(async_session: AsyncSession):
     async_session.add(child)
     await async_session.commit()
 
-    yield child
-
-    await async_session.delete(child)
-    await async_session.commit()
+    return child
 
 
 @async_fixture()
@@ -347,10 +323,7 @@ async def child_2(async_session: AsyncSession):
     async_session.add(child)
     await async_session.commit()
 
-    yield child
-
-    await async_session.delete(child)
-    await async_session.commit()
+    return child
 
 
 @async_fixture()
@@ -361,10 +334,7 @@ async def child_3(async_session: AsyncSession):
     async_session.add(child)
     await async_session.commit()
 
-    yield child
-
-    await async_session.delete(child)
-    await async_session.commit()
+    return child
 
 
 @async_fixture()
@@ -375,110 +345,25 @@ async def child_4(async_session: AsyncSession):
     async_session.add(child)
     await async_session.commit()
 
-    yield child
-
-    await async_session.delete(child)
-    await async_session.commit()
-
-
-@async_fixture()
-async def p1_c1_association(
-    async_session: AsyncSession,
-    parent_1: Parent,
-    child_1: Child,
-):
-    assoc = ParentToChildAssociation(
-        parent=parent_1,
-        child=child_1,
-        extra_data="assoc_p1c1_extra",
-    )
-    async_session.add(assoc)
-    await async_session.commit()
-
-    yield assoc
-
-    await async_session.delete(assoc)
-    await async_session.commit()
-
-
-@async_fixture()
-async def p2_c1_association(
-    async_session: AsyncSession,
-    parent_2: Parent,
-    child_1: Child,
-):
-    assoc = ParentToChildAssociation(
-        parent=parent_2,
-        child=child_1,
-        extra_data="assoc_p2c1_extra",
-    )
-    async_session.add(assoc)
-    await async_session.commit()
-
-    yield assoc
-
-    await async_session.delete(assoc)
-    await async_session.commit()
-
-
-@async_fixture()
-async def p1_c2_association(
-    async_session: AsyncSession,
-    parent_1: Parent,
-    child_2: Child,
-):
-    assoc = ParentToChildAssociation(
-        parent=parent_1,
-        child=child_2,
-        extra_data="assoc_p1c2_extra",
-    )
-    async_session.add(assoc)
-    await async_session.commit()
-
-    yield assoc
-
-    await async_session.delete(assoc)
-    await async_session.commit()
+    return child
 
 
 @async_fixture()
-async def p2_c2_association(
+async def association_factory(
     async_session: AsyncSession,
-    parent_2: Parent,
-    child_2: Child,
-):
-    assoc = ParentToChildAssociation(
-        parent=parent_2,
-        child=child_2,
-        extra_data="assoc_p2c2_extra",
-    )
-    async_session.add(assoc)
-    await async_session.commit()
-
-    yield assoc
-
-    await async_session.delete(assoc)
-    await async_session.commit()
-
-
-@async_fixture()
-async def p2_c3_association(
-    async_session: AsyncSession,
-    parent_2: Parent,
-    child_3: Child,
-):
-    assoc = ParentToChildAssociation(
-        parent=parent_2,
-        child=child_3,
-        extra_data="assoc_p2c3_extra",
-    )
-    async_session.add(assoc)
-    await async_session.commit()
-
-    yield assoc
+) -> Callable[[list[tuple[Parent, Child]]], Awaitable[list[ParentToChildAssociation]]]:
+    async def factory(pairs: list[tuple[Parent, Child]]) -> list[ParentToChildAssociation]:
+        rows = [
+            {
+                "parent_left_id": parent.id,
+                "child_right_id": child.id,
+                "extra_data": f"assoc_{parent.name}_{child.name}_extra",
+            }
+            for parent, child in pairs
+        ]
+        return await bulk_create(async_session, ParentToChildAssociation, rows)
 
-    await async_session.delete(assoc)
-    await async_session.commit()
+    return factory
 
 
 def build_task(**fields):
@@ -507,7 +392,7 @@ async def task_1(
                 "task_ids_dict_jsonb": {"completed": ["a", "b", "c"], "count": 2, "is_complete": True},
             },
         )
-    yield await create_task(async_session, **fields)
+    return await create_task(async_session, **fields)
 
 
 @async_fixture()
@@ -525,7 +410,7 @@ async def task_2(
                 "task_ids_dict_jsonb": {"completed": ["d", "e", "f"], "count": 4, "is_complete": False},
             },
         )
-    yield await create_task(async_session, **fields)
+    return await create_task(async_session, **fields)
 
 
 def build_workplace(**fields):
@@ -543,11 +428,11 @@ async def create_workplace(async_session: AsyncSession, **fields):
 async def workplace_1(
     async_session: AsyncSession,
 ):
-    yield await create_workplace(async_session, name="workplace_1")
+    return await create_workplace(async_session, name="workplace_1")
 
 
 @async_fixture()
 async def workplace_2(
     async_session: AsyncSession,
 ):
-    yield await create_workplace(async_session, name="workplace_2")
+    return await create_workplace(async_session, name="workplace_2")
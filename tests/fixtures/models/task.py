@@ -5,7 +5,9 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from examples.api_for_sqlalchemy.models.base import Base
-from tests.common import is_postgres_tests
+
+# JSONB on Postgres, plain JSON elsewhere
+JSONOrJSONB = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Task(Base):
@@ -14,6 +16,5 @@ class Task(Base):
     task_ids_dict_json: Mapped[Optional[dict]] = mapped_column(JSON, unique=False)
     task_ids_list_json: Mapped[Optional[list]] = mapped_column(JSON, unique=False)
 
-    if is_postgres_tests():
-        task_ids_dict_jsonb: Mapped[Optional[dict]] = mapped_column(JSONB, unique=False)
-        task_ids_list_jsonb: Mapped[Optional[list]] = mapped_column(JSONB, unique=False)
+    task_ids_dict_jsonb: Mapped[Optional[dict]] = mapped_column(JSONOrJSONB, unique=False)
+    task_ids_list_jsonb: Mapped[Optional[list]] = mapped_column(JSONOrJSONB, unique=False)
@@ -29,3 +29,14 @@ __all__ = (
     "TaskPatchSchema",
     "TaskSchema",
 )
+
+
+# all schemas are imported here, so forward references between them are resolved
+# once at import time instead of on the first use of each schema
+for _schema in (
+    AlphaSchema,
+    BetaSchema,
+    DeltaSchema,
+    GammaSchema,
+):
+    _schema.model_rebuild()
@@ -1,8 +1,8 @@
 import logging
 from collections import defaultdict
 from datetime import datetime, timezone
-from itertools import chain
-from typing import Annotated, Literal
+from operator import itemgetter
+from typing import Annotated, Literal, Optional
 from unittest import mock
 from unittest.mock import call
 from uuid import UUID, uuid4
@@ -10,10 +10,9 @@ from uuid import UUID, uuid4
 import orjson as json
 import pytest
 from fastapi import FastAPI, status
-from fastapi.datastructures import QueryParams
 from httpx import AsyncClient
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from examples.api_for_sqlalchemy.models import Computer, Post, PostComment, User, UserBio, Workplace
@@ -33,13 +32,15 @@ from fastapi_jsonapi.types_metadata.custom_filter_sql import sql_filter_lower_eq
 from fastapi_jsonapi.types_metadata.custom_sort_sql import sql_register_free_sort
 from tests.common import is_postgres_tests
 from tests.fixtures.app import build_alphabet_app, build_app_custom
+from tests.fixtures.db_connection import db
 from tests.fixtures.entities import (
+    build_user,
+    build_workplace,
     create_computer,
     create_post,
     create_post_comment,
     create_user,
     create_user_bio,
-    create_workplace,
 )
 from tests.fixtures.models import (
     Alpha,
@@ -57,8 +58,8 @@ from tests.misc.utils import fake
 logging.basicConfig(level=logging.DEBUG)
 
 
-def association_key(data: dict):
-    return data["type"], data["id"]
+# (type, id) of a resource object or identifier
+association_key = itemgetter("type", "id")
 
 
 async def test_root(client: AsyncClient):
@@ -75,9 +76,9 @@ async def test_get_users(app: FastAPI, client: AsyncClient, user_1: User, user_2
     users_data = response_data["data"]
     users = [user_1, user_2]
     assert len(users_data) == len(users)
-    for user_data, user in zip(users_data, users):
-        assert user_data["id"] == f"{user.id}"
-        assert user_data["type"] == "user"
+    assert {(user_data["type"], user_data["id"]) for user_data in users_data} == {
+        ("user", str(user.id)) for user in users
+    }
 
 
 async def test_get_user_with_bio_relation(
@@ -116,9 +117,9 @@ async def test_get_users_with_bio_relation(
     users_data = response_data["data"]
     users = [user_1, user_2]
     assert len(users_data) == len(users)
-    for user_data, user in zip(users_data, users):
-        assert user_data["id"] == f"{user.id}"
-        assert user_data["type"] == "user"
+    assert {(user_data["type"], user_data["id"]) for user_data in users_data} == {
+        ("user", str(user.id)) for user in users
+    }
 
     assert "included" in response_data, response_data
     included_bio = response_data["included"][0]
@@ -181,8 +182,7 @@ class TestGetUsersList:
         url = app.url_path_for("get_user_list")
         user_1, user_2 = sorted((user_1, user_2), key=lambda x: x.id)
 
-        params = QueryParams(fields)
-        response = await client.get(url, params=f"{params}")
+        response = await client.get(url, params=fields)
 
         assert response.status_code == status.HTTP_200_OK, response.text
         response_data = response.json()
@@ -224,21 +224,19 @@ class TestGetUsersList:
         queried_user_fields = "name"
         queried_post_fields = "title"
 
-        params = QueryParams(
-            [
-                ("fields[user]", queried_user_fields),
-                ("fields[post]", queried_post_fields),
-                # empty str means ignore all fields
-                ("fields[post_comment]", ""),
-                ("include", "posts,posts.comments"),
-                ("sort", "id"),
-            ],
-        )
-        response = await client.get(url, params=f"{params}")
+        params = [
+            ("fields[user]", queried_user_fields),
+            ("fields[post]", queried_post_fields),
+            # empty str means ignore all fields
+            ("fields[post_comment]", ""),
+            ("include", "posts,posts.comments"),
+            ("sort", "id"),
+        ]
+        response = await client.get(url, params=params)
 
         assert response.status_code == status.HTTP_200_OK, response.text
         response_data = response.json()
-        response_data["included"] = sorted(response_data["included"], key=lambda x: (x["type"], x["id"]))
+        response_data["included"] = sorted(response_data["included"], key=itemgetter("type", "id"))
 
         assert response_data == {
             "data": [
@@ -326,7 +324,7 @@ class TestGetUsersList:
                         "type": "post_comment",
                     },
                 ],
-                key=lambda x: (x["type"], x["id"]),
+                key=itemgetter("type", "id"),
             ),
         }
 
@@ -338,8 +336,8 @@ class TestGetUsersList:
     ):
         url = app.url_path_for("get_user_list")
 
-        params = QueryParams([("fields[post]", "title")])
-        response = await client.get(url, params=f"{params}")
+        params = [("fields[post]", "title")]
+        response = await client.get(url, params=params)
 
         assert response.status_code == status.HTTP_200_OK, response.text
         response_data = response.json()
@@ -380,38 +378,35 @@ class TestCreatePostAndComments:
         assert response.status_code == status.HTTP_200_OK
         response_data = response.json()
         assert "data" in response_data, response_data
-        u1_posts = list(user_1_posts)
-        u2_posts = list(user_2_posts)
-        posts = list(chain(u1_posts, u2_posts))
+        posts = user_1_posts + user_2_posts
 
-        posts_data = list(response_data["data"])
+        posts_data = response_data["data"]
         assert len(posts) == len(posts_data)
 
         assert "included" in response_data, response_data
         users = [user_1, user_2]
         included_users = response_data["included"]
         assert len(included_users) == len(users)
-        for user_data, user in zip(included_users, users):
-            assert user_data["id"] == f"{user.id}"
-            assert user_data["type"] == "user"
+        assert {(user_data["type"], user_data["id"]) for user_data in included_users} == {
+            ("user", str(user.id)) for user in users
+        }
 
         for post_data, post in zip(posts_data, posts):
             assert post_data["id"] == f"{post.id}"
             assert post_data["type"] == "post"
 
-        all_posts_data = list(posts_data)
         idx_start = 0
-        for posts, user in [
-            (u1_posts, user_1),
-            (u2_posts, user_2),
+        for user_posts, user in [
+            (user_1_posts, user_1),
+            (user_2_posts, user_2),
         ]:
-            next_idx = len(posts) + idx_start
-            posts_data = all_posts_data[idx_start:next_idx]
+            next_idx = len(user_posts) + idx_start
+            user_posts_data = posts_data[idx_start:next_idx]
 
-            assert len(posts_data) == len(posts)
+            assert len(user_posts_data) == len(user_posts)
             idx_start = next_idx
 
-            for post_data in posts_data:
+            for post_data in user_posts_data:
                 user_relation = post_data["relationships"]["user"]
                 assert user_relation["data"] == {
                     "id": f"{user.id}",
@@ -552,18 +547,49 @@ class TestCreatePostAndComments:
             },
         ]
 
-    async def test_create_comment_error_no_relationship(
+    @pytest.mark.parametrize(
+        ("relationships", "expected_errors"),
+        [
+            pytest.param(
+                # don't pass "user"
+                {"post": {"data": {"type": "post", "id": "1"}}},
+                [(["body", "data", "relationships", "user"], "Field required")],
+                id="no_relationship",
+            ),
+            pytest.param(
+                # don't pass "post" and "user"
+                {},
+                [
+                    (["body", "data", "relationships", "post"], "Field required"),
+                    (["body", "data", "relationships", "user"], "Field required"),
+                ],
+                id="no_relationships_content",
+            ),
+            pytest.param(
+                # don't pass "relationships" at all
+                None,
+                [(["body", "data", "relationships"], "Field required")],
+                id="no_relationships_field",
+            ),
+        ],
+    )
+    async def test_create_comment_error(
         self,
         app: FastAPI,
         client: AsyncClient,
-        user_1_post: Post,
+        relationships: Optional[dict],
+        expected_errors: list[tuple[list[str], str]],
     ):
         """
         Check schema is built properly
 
-        :param app
+        Request body is rejected before any DB access,
+        so the related post doesn't need to exist
+
+        :param app:
         :param client:
-        :param user_1_post:
+        :param relationships:
+        :param expected_errors:
         :return:
         """
         url = app.url_path_for("get_post_comment_list")
@@ -573,72 +599,15 @@ class TestCreatePostAndComments:
         comment_create = {
             "data": {
                 "attributes": comment_attributes,
-                "relationships": {
-                    "post": {
-                        "data": {
-                            "type": "post",
-                            "id": f"{user_1_post.id}",
-                        },
-                    },
-                    # don"t pass "user"
-                },
-            },
-        }
-        response = await client.post(url, json=comment_create)
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
-        response_data = response.json()
-        detail, *_ = response_data["detail"]
-        assert detail["loc"] == ["body", "data", "relationships", "user"]
-        assert detail["msg"] == "Field required"
-
-    async def test_create_comment_error_no_relationships_content(
-        self,
-        app: FastAPI,
-        client: AsyncClient,
-    ):
-        url = app.url_path_for("get_post_comment_list")
-        comment_attributes = PostCommentAttributesBaseSchema(
-            text=fake.sentence(),
-        ).model_dump()
-        comment_create = {
-            "data": {
-                "attributes": comment_attributes,
-                "relationships": {
-                    # don"t pass "post"
-                    # don"t pass "user"
-                },
             },
         }
-        response = await client.post(url, json=comment_create)
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
-        response_data = response.json()
-        detail_1, detail_2 = response_data["detail"]
-        assert detail_1["loc"] == ["body", "data", "relationships", "post"]
-        assert detail_1["msg"] == "Field required"
-        assert detail_2["loc"] == ["body", "data", "relationships", "user"]
-        assert detail_2["msg"] == "Field required"
+        if relationships is not None:
+            comment_create["data"]["relationships"] = relationships
 
-    async def test_create_comment_error_no_relationships_field(
-        self,
-        app: FastAPI,
-        client: AsyncClient,
-    ):
-        url = app.url_path_for("get_post_comment_list")
-        comment_attributes = PostCommentAttributesBaseSchema(
-            text=fake.sentence(),
-        ).model_dump()
-        comment_create = {
-            "data": {
-                "attributes": comment_attributes,
-                # don"t pass "relationships" at all
-            },
-        }
         response = await client.post(url, json=comment_create)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
         response_data = response.json()
-        detail, *_ = response_data["detail"]
-        assert detail["loc"] == ["body", "data", "relationships"]
-        assert detail["msg"] == "Field required"
+        assert [(detail["loc"], detail["msg"]) for detail in response_data["detail"]] == expected_errors
 
 
 async def test_get_users_with_all_inner_relations(
@@ -727,6 +696,33 @@ async def test_get_users_with_all_inner_relations(
                 assert ("user", f"{comment_user.id}") in included_data
 
 
+async def test_includes_loaded_without_query_per_item(
+    app: FastAPI,
+    client: AsyncClient,
+    user_1: User,
+    user_2: User,
+    user_1_bio: UserBio,
+    user_1_posts: list[Post],
+    user_2_posts: list[Post],
+):
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    url = app.url_path_for("get_user_list")
+    event.listen(db.engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        response = await client.get(f"{url}?include=bio,posts")
+    finally:
+        event.remove(db.engine.sync_engine, "before_cursor_execute", on_execute)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert len(response.json()["data"]) == len([user_1, user_2])
+    # count, users joined with bio, posts selectin - no query per user
+    assert len(statements) == len(["count", "users", "posts"]), statements
+
+
 async def test_many_to_many_load_inner_includes_to_parents(
     app: FastAPI,
     client: AsyncClient,
@@ -737,12 +733,23 @@ async def test_many_to_many_load_inner_includes_to_parents(
     child_2,
     child_3,
     child_4,
-    p1_c1_association,
-    p2_c1_association,
-    p1_c2_association,
-    p2_c2_association,
-    p2_c3_association,
+    association_factory,
 ):
+    (
+        p1_c1_association,
+        p2_c1_association,
+        p1_c2_association,
+        p2_c2_association,
+        p2_c3_association,
+    ) = await association_factory(
+        [
+            (parent_1, child_1),
+            (parent_2, child_1),
+            (parent_1, child_2),
+            (parent_2, child_2),
+            (parent_2, child_3),
+        ],
+    )
     url = app.url_path_for("get_parent_list")
     url = f"{url}?include=children,children.child"
     response = await client.get(url)
@@ -753,7 +760,7 @@ async def test_many_to_many_load_inner_includes_to_parents(
     assert len(parents_data) == len(parents)
 
     included = response_data["included"]
-    included_data = {(data["type"], data["id"]): data for data in included}
+    included_data = {association_key(data): data for data in included}
 
     for parent_data, (parent, expected_assocs) in zip(
         parents_data,
@@ -796,7 +803,7 @@ class TestGetUserDetail:
     ):
         url = self.get_url(app, user_1.id)
         queried_user_fields = "name,age"
-        params = QueryParams([("fields[user]", queried_user_fields)])
+        params = [("fields[user]", queried_user_fields)]
         response = await client.get(url, params=params)
 
         assert response.status_code == status.HTTP_200_OK
@@ -853,7 +860,7 @@ class TestUserFetchRelationships:
         user_1_bio: UserBio,
     ):
         url = self.get_url(app, user_1.id, "bio")
-        params = QueryParams([("include", "user")])
+        params = [("include", "user")]
 
         response = await client.get(url, params=params)
         assert response.status_code == status.HTTP_200_OK, response.text
@@ -907,7 +914,7 @@ class TestUserFetchRelationships:
         user_1_posts: list[Post],
     ):
         url = self.get_url(app, user_1.id, "posts", many=True)
-        params = QueryParams([("include", "user")])
+        params = [("include", "user")]
 
         response = await client.get(url, params=params)
         assert response.status_code == status.HTTP_200_OK, response.text
@@ -1693,7 +1700,7 @@ class TestCreateObjects:
             },
         }
         queried_user_fields = "name"
-        params = QueryParams([("fields[user]", queried_user_fields)])
+        params = [("fields[user]", queried_user_fields)]
         url = app.url_path_for("get_user_list")
         res = await client.post(url, json=create_user_body, params=params)
         assert res.status_code == status.HTTP_201_CREATED, res.text
@@ -1792,7 +1799,7 @@ class TestPatchObjects:
             },
         }
         queried_user_fields = "name"
-        params = QueryParams([("fields[user]", queried_user_fields)])
+        params = [("fields[user]", queried_user_fields)]
         url = app.url_path_for("get_user_detail", obj_id=user_1.id)
         res = await client.patch(url, params=params, json=patch_user_body)
 
@@ -2490,12 +2497,10 @@ class TestDeleteObjects:
         user_2: User,
     ):
         queried_user_fields = "name"
-        params = QueryParams(
-            [
-                ("fields[user]", queried_user_fields),
-                ("sort", "id"),
-            ],
-        )
+        params = [
+            ("fields[user]", queried_user_fields),
+            ("sort", "id"),
+        ]
         url = app.url_path_for("get_user_list")
         res = await client.delete(url, params=params)
         assert res.status_code == status.HTTP_200_OK, res.text
@@ -3041,18 +3046,20 @@ class TestFilters:
         workplace_name = "Common workplace name"
 
         workplace_1, workplace_2, workplace_3, workplace_4 = (
-            await create_workplace(async_session, name=workplace_name),
-            await create_workplace(async_session, name=workplace_name),
-            await create_workplace(async_session, name=workplace_name),
-            await create_workplace(async_session, name=workplace_name),
+            build_workplace(name=workplace_name),
+            build_workplace(name=workplace_name),
+            build_workplace(name=workplace_name),
+            build_workplace(name=workplace_name),
         )
 
-        user_1, user_2, _, user_4 = (
-            await create_user(async_session, name="John Doe", age=20, workplace=workplace_1),
-            await create_user(async_session, name="Jane Doe", age=25, workplace=workplace_2),
-            await create_user(async_session, name="Jonny Doe", age=30, workplace=workplace_3),
-            await create_user(async_session, name="Mary Jane", age=21, workplace=workplace_4),
+        users = user_1, user_2, _, user_4 = (
+            build_user(name="John Doe", age=20, workplace=workplace_1),
+            build_user(name="Jane Doe", age=25, workplace=workplace_2),
+            build_user(name="Jonny Doe", age=30, workplace=workplace_3),
+            build_user(name="Mary Jane", age=21, workplace=workplace_4),
         )
+        async_session.add_all(users)
+        await async_session.commit()
 
         params = {
             "filter": json.dumps(
@@ -3517,11 +3524,13 @@ class TestSorts:
         async_session: AsyncSession,
         order: str,
     ):
-        user_1, _, user_3 = (
-            await create_user(async_session, age=10),
-            await create_user(async_session),
-            await create_user(async_session, age=15),
+        users = user_1, _, user_3 = (
+            build_user(age=10),
+            build_user(),
+            build_user(age=15),
         )
+        async_session.add_all(users)
+        await async_session.commit()
 
         params = {
             "filter": json.dumps(
@@ -3692,9 +3701,9 @@ class TestSorts:
         resource_type = "test_register_free_sort"
 
         # lexicographic order: Anton, Boris, anton
-        await create_user(async_session, name="Anton")
-        await create_user(async_session, name="anton")
-        target_user = await create_user(async_session, name="Boris")
+        target_user = build_user(name="Boris")
+        async_session.add_all([build_user(name="Anton"), build_user(name="anton"), target_user])
+        await async_session.commit()
 
         class UserWithNameFieldSortingSchema(UserAttributesBaseSchema):
             name: Annotated[str, sql_register_free_sort]
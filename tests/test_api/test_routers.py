@@ -1,14 +1,19 @@
-from typing import ClassVar, Optional
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Annotated, ClassVar, Optional
 
+import pytest
 from fastapi import APIRouter, Depends, FastAPI, Header, Path, status
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from httpx import AsyncClient
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated
 
-from examples.api_for_sqlalchemy.models import User
+from examples.api_for_sqlalchemy.models import Computer, User
 from examples.api_for_sqlalchemy.schemas import (
+    ComputerSchema,
     UserAttributesBaseSchema,
     UserInSchema,
     UserPatchSchema,
@@ -17,6 +22,7 @@ from examples.api_for_sqlalchemy.schemas import (
 from fastapi_jsonapi import ApplicationBuilder
 from fastapi_jsonapi.exceptions import Forbidden, InternalServerError
 from fastapi_jsonapi.misc.sqla.generics.base import ViewBaseGeneric
+from fastapi_jsonapi.types_metadata import RelationshipInfo
 from fastapi_jsonapi.views import Operation, OperationConfig, ViewBase
 from tests.fixtures.db_connection import async_session_dependency
 from tests.fixtures.views import SessionDependency
@@ -114,6 +120,183 @@ async def test_dependency_handler_call():
         }
 
 
+async def test_dataclass_dependencies_merge(user_1: User):
+    def get_path_obj_id(obj_id: int = Path(default=...)):
+        return obj_id
+
+    @dataclass
+    class CommonDependency:
+        session: AsyncSession = Depends(async_session_dependency)
+
+    @dataclass
+    class GetDependency:
+        custom_name_obj_id: int = Depends(get_path_obj_id)
+
+    def common_handler(view: ViewBase, dto: CommonDependency) -> dict:
+        return {
+            "session": dto.session,
+        }
+
+    def get_handler(view: ViewBase, dto: CommonDependency) -> dict:
+        # both dataclasses fields are passed to the handler
+        raise InternalServerError(
+            detail=sorted(field.name for field in fields(dto)),
+            parameter=f"{dto.custom_name_obj_id}",
+        )
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=CommonDependency,
+                prepare_data_layer_kwargs=common_handler,
+            ),
+            Operation.GET: OperationConfig(
+                dependencies=GetDependency,
+                prepare_data_layer_kwargs=get_handler,
+            ),
+        }
+
+    resource_type = "test_dataclass_dependencies_merge"
+    app = build_app(DependencyInjectionView, resource_type=resource_type)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR, res.text
+        assert res.json() == {
+            "errors": [
+                {
+                    "detail": ["custom_name_obj_id", "session"],
+                    "source": {"parameter": f"{user_1.id}"},
+                    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "title": "Internal Server Error",
+                },
+            ],
+        }
+
+        res = await client.get(app.url_path_for(f"get_{resource_type}_list"))
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+
+async def test_dataclass_dependencies_required_field(user_1: User):
+    @dataclass
+    class HeaderDependency:
+        x_auth: Annotated[str, Header()]
+        session: AsyncSession = Depends(async_session_dependency)
+
+    def common_handler(view: ViewBase, dto: HeaderDependency) -> dict:
+        assert dto.x_auth == "admin"
+        return {
+            "session": dto.session,
+        }
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=HeaderDependency,
+                prepare_data_layer_kwargs=common_handler,
+            ),
+        }
+
+    app = build_app(DependencyInjectionView, resource_type="test_dataclass_dependencies_required_field")
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, res.text
+
+        res = await client.get(f"/users/{user_1.id}/", headers={"X-AUTH": "admin"})
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+
+def test_dataclass_dependencies_default_factory_rejected():
+    @dataclass
+    class FactoryDependency:
+        tags: list[str] = field(default_factory=list)
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(dependencies=FactoryDependency),
+        }
+
+    with pytest.raises(ValueError, match="default_factory"):
+        build_app(DependencyInjectionView, resource_type="test_dataclass_dependencies_default_factory_rejected")
+
+
+def test_mixed_dependencies_kinds_rejected():
+    @dataclass
+    class GetDependency:
+        session: AsyncSession = Depends(async_session_dependency)
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(dependencies=SessionDependency),
+            Operation.GET: OperationConfig(dependencies=GetDependency),
+        }
+
+    with pytest.raises(ValueError, match="both pydantic models or both dataclasses"):
+        build_app(DependencyInjectionView, resource_type="test_mixed_dependencies_kinds_rejected")
+
+
+async def test_common_handler_called_once(user_1: User):
+    handler_calls = []
+
+    def common_handler(view: ViewBase, dto: SessionDependency) -> dict:
+        handler_calls.append(view.operation)
+        return {
+            "session": dto.session,
+        }
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=SessionDependency,
+                prepare_data_layer_kwargs=common_handler,
+            ),
+        }
+
+    app = build_app(DependencyInjectionView, resource_type="test_common_handler_called_once")
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+    assert handler_calls == [Operation.GET]
+
+
+async def test_shared_handler_called_for_common_and_operation_configs(user_1: User):
+    handler_calls = []
+
+    def get_path_obj_id(obj_id: int = Path(default=...)):
+        return obj_id
+
+    class GetDependency(BaseModel):
+        custom_name_obj_id: int = Depends(get_path_obj_id)
+
+    def shared_handler(view: ViewBase, dto: SessionDependency) -> dict:
+        # the operation dependencies are merged with the common ones
+        handler_calls.append(type(dto))
+        return {
+            "session": dto.session,
+        }
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=SessionDependency,
+                prepare_data_layer_kwargs=shared_handler,
+            ),
+            Operation.GET: OperationConfig(
+                dependencies=GetDependency,
+                prepare_data_layer_kwargs=shared_handler,
+            ),
+        }
+
+    app = build_app(DependencyInjectionView, resource_type="test_shared_handler_called_for_common_and_operation")
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+    common_dto_class, operation_dto_class = handler_calls
+    assert common_dto_class is SessionDependency
+    assert issubclass(operation_dto_class, GetDependency)
+
+
 async def test_dependencies_as_permissions(user_1: User):
     async def check_that_user_is_admin(x_auth: Annotated[str, Header()]):
         if x_auth != "admin":
@@ -214,3 +397,100 @@ async def test_manipulate_data_layer_kwargs(
                 },
             ],
         }
+
+
+def test_resource_routes_use_orjson_response():
+    resource_type = "test_resource_routes_use_orjson_response"
+    app = build_app(ViewBaseGeneric, resource_type=resource_type)
+
+    routes = {route.name: route for route in app.routes if isinstance(route, APIRoute)}
+
+    assert routes[f"get_{resource_type}_list"].response_class is ORJSONResponse
+    assert routes[f"get_{resource_type}_detail"].response_class is ORJSONResponse
+
+
+async def test_inline_handler_runs_in_event_loop_thread(user_1: User):
+    handler_threads = []
+
+    def common_handler(view: ViewBase, dto: SessionDependency) -> dict:
+        handler_threads.append(threading.get_ident())
+        return {
+            "session": dto.session,
+        }
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=SessionDependency,
+                prepare_data_layer_kwargs=common_handler,
+                run_inline=True,
+            ),
+        }
+
+    app = build_app(DependencyInjectionView, resource_type="test_inline_handler_runs_in_event_loop_thread")
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+    assert handler_threads == [threading.get_ident()]
+
+
+async def test_query_params_stored_on_request_state(user_1: User):
+    views = []
+
+    def common_handler(view: ViewBase, dto: SessionDependency) -> dict:
+        views.append(view)
+        return {
+            "session": dto.session,
+        }
+
+    class DependencyInjectionView(ViewBaseGeneric):
+        operation_dependencies: ClassVar[dict[Operation, OperationConfig]] = {
+            Operation.ALL: OperationConfig(
+                dependencies=SessionDependency,
+                prepare_data_layer_kwargs=common_handler,
+            ),
+        }
+
+    app = build_app(DependencyInjectionView, resource_type="test_query_params_stored_on_request_state")
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get(f"/users/{user_1.id}/")
+        assert res.status_code == status.HTTP_200_OK, res.text
+
+    [view] = views
+    assert view.request.state.jsonapi_query_params is view.query_params
+
+
+def test_initialize_with_relationship_missing_on_model():
+    computer_resource_type = "test_initialize_with_relationship_missing_on_model_computer"
+
+    class UserWithVirtualRelationshipSchema(UserAttributesBaseSchema):
+        id: int
+        # there is no such relationship on the User model
+        virtual_computer: Annotated[
+            Optional[ComputerSchema],
+            RelationshipInfo(resource_type=computer_resource_type),
+        ] = None
+
+    app = FastAPI()
+    builder = ApplicationBuilder(app)
+    builder.add_resource(
+        path="/virtual-computers",
+        tags=["Computer"],
+        view=ViewBaseGeneric,
+        schema=ComputerSchema,
+        resource_type=computer_resource_type,
+        model=Computer,
+    )
+    builder.add_resource(
+        path="/virtual-users",
+        tags=["User"],
+        view=ViewBaseGeneric,
+        schema=UserWithVirtualRelationshipSchema,
+        resource_type="test_initialize_with_relationship_missing_on_model_user",
+        model=User,
+    )
+    builder.initialize()
+
+    routes = {route.name for route in app.routes if isinstance(route, APIRoute)}
+    assert "get_test_initialize_with_relationship_missing_on_model_user_list" in routes
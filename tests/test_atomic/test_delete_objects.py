@@ -18,10 +18,9 @@ class TestAtomicDeleteObjects:
         self,
         client: AsyncClient,
         async_session: AsyncSession,
-        computer_factory: Callable[..., Awaitable[Computer]],
+        computers_factory: Callable[[int], Awaitable[list[Computer]]],
     ):
-        computer_1 = await computer_factory()
-        computer_2 = await computer_factory()
+        computer_1, computer_2 = await computers_factory(2)
 
         computers_ids = [
             computer_1.id,
@@ -1,11 +1,11 @@
-from typing import Any
+from typing import Annotated, Any
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from fastapi import status
 from pydantic import BaseModel, ConfigDict
 
-from fastapi_jsonapi.data_layers.sqla.query_building import build_filter_expression
+from fastapi_jsonapi.data_layers.sqla.query_building import build_filter_expression, cast_value_with_schema
 from fastapi_jsonapi.exceptions import InvalidType
 
 
@@ -70,3 +70,8 @@ class TestFilteringFuncs:
             "status_code": status.HTTP_409_CONFLICT,
             "title": "Invalid type.",
         }
+
+    def test_cast_with_unhashable_annotated_metadata(self):
+        field_type = Annotated[int, {"description": "unhashable metadata"}]
+
+        assert cast_value_with_schema(field_types=[field_type], value="1") == (1, [])
@@ -90,3 +90,22 @@ def test_filters__errors():
             },
         ],
     }
+
+
+def test_parsed_values_are_reused():
+    request = MagicMock()
+    request.query_params = QueryParams(
+        [
+            ("filter%5Bname%5D", "John"),
+            ("sort", "-name,bio.birth_city"),
+        ],
+    )
+    manager = QueryStringManager(request)
+
+    assert manager.filters == [{"name": "name", "op": "eq", "val": "John"}]
+    assert manager.filters is manager.filters
+    assert manager.sorts == [
+        {"field": "name", "order": "desc", "rel_path": None},
+        {"field": "bio.birth_city", "order": "asc", "rel_path": "bio"},
+    ]
+    assert manager.sorts is manager.sorts
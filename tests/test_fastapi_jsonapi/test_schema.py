@@ -0,0 +1,10 @@
+from fastapi_jsonapi.schema import BaseJSONAPIRelationshipDataToOneSchema, BaseJSONAPIRelationshipSchema
+
+
+def test_relationship_fast_build():
+    relationship = BaseJSONAPIRelationshipSchema.fast_build(id="1", type="user")
+
+    assert relationship == BaseJSONAPIRelationshipSchema(id="1", type="user")
+    assert BaseJSONAPIRelationshipDataToOneSchema.model_construct(data=relationship).model_dump() == {
+        "data": {"id": "1", "type": "user"},
+    }
@@ -0,0 +1,52 @@
+from examples.api_for_sqlalchemy.schemas import UserAttributesBaseSchema, UserSchema
+from fastapi_jsonapi.storages.schemas_storage import SchemasStorage
+from fastapi_jsonapi.types_metadata import RelationshipInfo
+
+
+def test_get_relationship_schema_does_not_mutate_storage():
+    storage = SchemasStorage()
+
+    assert storage.get_relationship_schema("user", "computer", "get", "computers") is None
+    assert storage.get_relationship_schema("user", "computer", "get", "computers") is None
+    assert storage.has_operation("user", "get") is False
+    assert storage.has_resource("user") is False
+
+    storage.add_relationship(
+        from_resource_type="user",
+        to_resource_type="computer",
+        operation_type="get",
+        field_name="computers",
+        relationship_schema=UserSchema,
+        relationship_info=RelationshipInfo(resource_type="computer", many=True),
+    )
+
+    assert storage.get_relationship_schema("user", "computer", "get", "computers") is UserSchema
+    assert storage.get_relationship_schema("user", "computer", "create", "computers") is None
+    assert storage.get_relationship_schema("user", "post", "get", "posts") is None
+    assert storage.has_operation("user", "get") is False
+
+
+def test_add_resource_is_readable_through_getters():
+    storage = SchemasStorage()
+    relationship_info = RelationshipInfo(resource_type="computer", many=True)
+    field_schemas = {"name": UserAttributesBaseSchema}
+
+    storage.add_resource(
+        builder=None,
+        resource_type="user",
+        operation_type="get",
+        source_schema=UserSchema,
+        data_schema=UserSchema,
+        attributes_schema=UserAttributesBaseSchema,
+        field_schemas=field_schemas,
+        relationships_info={"computers": (relationship_info, None)},
+        model_validators=({}, {}),
+    )
+
+    assert storage.has_operation("user", "get") is True
+    assert storage.has_operation("user", "create") is False
+    assert storage.get_source_schema("user") is UserSchema
+    assert storage.get_data_schema("user", "get") is UserSchema
+    assert storage.get_attrs_schema("user", "get") is UserAttributesBaseSchema
+    assert storage.get_field_schemas("user", "get") == field_schemas
+    assert storage.get_relationships_info("user", "get") == {"computers": relationship_info}
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from pydantic import BaseModel, ConfigDict, computed_field
+
+from fastapi_jsonapi.views import OperationConfig
+from fastapi_jsonapi.views.view_base import ViewBase
+
+
+class ItemAttributesSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+
+
+class ItemSchema(BaseModel):
+    type: str = "item"
+    attributes: ItemAttributesSchema
+    id: str
+    meta: dict = {"tags": []}
+
+
+def test_prepare_item_data_does_not_share_nested_defaults():
+    item_schemas = (ItemAttributesSchema, ItemSchema)
+
+    first_item = ViewBase._prepare_item_data(SimpleNamespace(id=1, name="a"), "item", item_schemas=item_schemas)
+    first_item["meta"]["tags"].append("changed")
+    second_item = ViewBase._prepare_item_data(SimpleNamespace(id=2, name="b"), "item", item_schemas=item_schemas)
+
+    assert second_item == {"type": "item", "attributes": {"name": "b"}, "id": "2", "meta": {"tags": []}}
+    assert list(second_item) == list(ItemSchema.model_fields)
+
+
+def test_prepare_item_data_uses_schema_with_computed_field():
+    class ComputedItemSchema(ItemSchema):
+        @computed_field
+        @property
+        def title(self) -> str:
+            return self.attributes.name.title()
+
+    item = ViewBase._prepare_item_data(
+        SimpleNamespace(id=1, name="item name"),
+        "item",
+        item_schemas=(ItemAttributesSchema, ComputedItemSchema),
+    )
+
+    assert item["title"] == "Item Name"
+
+
+def test_operation_config_async_handler_check_follows_handler():
+    async def async_handler(view: ViewBase) -> dict:
+        return {}
+
+    def sync_handler(view: ViewBase) -> dict:
+        return {}
+
+    config = OperationConfig(prepare_data_layer_kwargs=async_handler)
+    assert config.is_async_handler is True
+
+    config_copy = config.model_copy(update={"prepare_data_layer_kwargs": sync_handler})
+    assert config_copy.is_async_handler is False
+    assert config.is_async_handler is True
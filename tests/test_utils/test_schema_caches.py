@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+
+from fastapi_jsonapi.utils.schema_caches import clear_schema_caches, schema_cache
+
+
+def test_clear_schema_caches():
+    calls = []
+
+    @schema_cache
+    def get_field_names(schema: type[BaseModel]) -> tuple[str, ...]:
+        calls.append(schema)
+        return tuple(schema.model_fields)
+
+    class Schema(BaseModel):
+        name: str
+
+    assert get_field_names(Schema) == ("name",)
+    assert get_field_names(Schema) == ("name",)
+    assert calls == [Schema]
+
+    clear_schema_caches()
+
+    assert get_field_names(Schema) == ("name",)
+    assert calls == [Schema, Schema]
@@ -0,0 +1,63 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, model_validator
+
+from fastapi_jsonapi.validation_utils import extract_validators, get_model_validators, get_type_adapter
+
+
+class TestGetTypeAdapter:
+    def test_adapter_is_reused_for_same_type(self):
+        assert get_type_adapter(int) is get_type_adapter(int)
+        assert get_type_adapter(int).validate_python("1") == 1
+
+    def test_adapter_for_annotated_type(self):
+        annotation = Annotated[int, Field(gt=0)]
+
+        adapter = get_type_adapter(annotation)
+
+        assert adapter is get_type_adapter(annotation)
+        assert adapter.validate_python("1") == 1
+
+    def test_adapter_for_unhashable_annotated_type(self):
+        annotation = Annotated[int, Field(gt=0), {"description": "unhashable metadata"}]
+
+        assert get_type_adapter(annotation).validate_python("1") == 1
+
+
+class TestGetModelValidators:
+    def test_validators_split_by_mode(self):
+        class Schema(BaseModel):
+            name: str
+
+            @model_validator(mode="before")
+            @classmethod
+            def before_check(cls, data):
+                return data
+
+            @model_validator(mode="after")
+            def after_check(self):
+                return self
+
+        before_validators, after_validators = get_model_validators(Schema)
+
+        assert list(before_validators) == ["before_check"]
+        assert list(after_validators) == ["after_check"]
+        assert get_model_validators(Schema) is get_model_validators(Schema)
+
+    def test_extract_validators_reuses_model_validators(self):
+        class Schema(BaseModel):
+            name: str
+
+            @model_validator(mode="after")
+            def after_check(self):
+                return self
+
+            @model_validator(mode="before")
+            @classmethod
+            def before_check(cls, data):
+                return data
+
+        before_validators, after_validators = get_model_validators(Schema)
+        _, model_validators = extract_validators(Schema)
+
+        assert model_validators == {**before_validators, **after_validators}